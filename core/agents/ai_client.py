@@ -6,19 +6,92 @@ Handles communication with AI services (OpenAI, Claude, etc.)
 
 import asyncio
 import json
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from abc import ABC, abstractmethod
+import httpx
 import openai
 from openai import AsyncOpenAI
+from .async_batcher import AsyncBatcher
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _make_http_client() -> httpx.AsyncClient:
+    """
+    Keep-alive connection pool for one OpenAIClient in one event loop, so agent
+    calls reuse TCP/TLS sessions instead of reconnecting per request
+    """
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=2,  # connection-level retries only; API errors are retried below
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        ),
+        timeout=httpx.Timeout(60.0, connect=10.0)
+    )
+
+
+async def _close_with_loop(client: AsyncOpenAI) -> AsyncIterator[None]:
+    """Suspended until its event loop shuts down, then closes client there"""
+    try:
+        yield
+    finally:
+        await client.close()
+
+
+def _bind_to_running_loop(client: AsyncOpenAI) -> AsyncIterator[None]:
+    """
+    Tie client's lifetime to the running event loop
+    
+    The returned generator is advanced to its yield without awaiting, which
+    registers it with the loop; asyncio.run() closes live async generators at
+    shutdown, and that closes the client while its connections' loop still runs.
+    Callers must keep a reference, as loops only track generators weakly.
+    """
+    closer = _close_with_loop(client)
+    try:
+        closer.__anext__().send(None)
+    except StopIteration:
+        pass
+    return closer
+
+
+# A system prompt is either plain text or a list of text blocks, e.g.
+#   [{"type": "text", "text": static, "cache_control": {"type": "ephemeral"}},
+#    {"type": "text", "text": dynamic}]
+# Blocks let providers with explicit prompt caching (Anthropic) cache the static
+# prefix; providers with automatic prefix caching (OpenAI) get the joined text.
+SystemPrompt = Union[str, List[Dict[str, Any]]]
+
+
+def flatten_system_prompt(system_prompt: SystemPrompt) -> str:
+    """Join system prompt blocks into a single string, static blocks first"""
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return "\n\n".join(block["text"] for block in system_prompt)
+
+
+def _rejects_prediction(error: "openai.BadRequestError") -> bool:
+    """Whether a bad request names the predicted-output parameter"""
+    return error.param == "prediction" or "prediction" in str(error).lower()
 
 
 class AIClient(ABC):
     """Abstract base class for AI service clients"""
     
+    # Coalescing window for generate_response_batched
+    BATCH_MAX_SIZE = 16
+    BATCH_MAX_LATENCY_MS = 10
+    
     @abstractmethod
     async def generate_response(
         self, 
-        system_prompt: str, 
+        system_prompt: SystemPrompt, 
         user_message: str, 
         chat_history: List[Dict[str, str]] = None,
         temperature: float = 0.7,
@@ -26,6 +99,114 @@ class AIClient(ABC):
     ) -> str:
         """Generate a response using the AI service"""
         pass
+    
+    async def generate_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Any]:
+        """
+        Generate responses for several requests at once
+        
+        Each request is a dict of generate_response keyword arguments, plus an
+        optional "prediction" draft for generate_predicted_response. Requests
+        are dispatched concurrently (bounded by max_concurrency) and results are
+        returned in order; a failed request yields its exception instead of a str.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(request: Dict[str, Any]) -> str:
+            async with semaphore:
+                if request.get("prediction") is not None:
+                    return await self.generate_predicted_response(**request)
+                request = {k: v for k, v in request.items() if k != "prediction"}
+                return await self.generate_response(**request)
+        
+        return await asyncio.gather(*(run(request) for request in requests), return_exceptions=True)
+    
+    async def generate_response_batched(
+        self,
+        system_prompt: SystemPrompt,
+        user_message: str,
+        prediction: Optional[str] = None,
+        chat_history: List[Dict[str, str]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500
+    ) -> str:
+        """
+        Generate a response, coalescing with concurrent callers
+        
+        Calls arriving within BATCH_MAX_LATENCY_MS of each other are flushed
+        together through generate_batch, which sends them as concurrent
+        independent requests under one concurrency bound. A prediction draft is
+        forwarded when given.
+        """
+        batcher = getattr(self, "_response_batcher", None)
+        if batcher is None:
+            batcher = self._response_batcher = AsyncBatcher(
+                self._flush_response_batch,
+                max_batch=self.BATCH_MAX_SIZE,
+                max_latency_ms=self.BATCH_MAX_LATENCY_MS
+            )
+        
+        return await batcher.submit({
+            "system_prompt": system_prompt,
+            "user_message": user_message,
+            "prediction": prediction,
+            "chat_history": chat_history,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        })
+    
+    async def _flush_response_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Flush function for generate_response_batched; override for a native batch endpoint"""
+        return await self.generate_batch(requests, max_concurrency=len(requests))
+    
+    async def generate_predicted_response(
+        self,
+        system_prompt: SystemPrompt,
+        user_message: str,
+        prediction: str,
+        chat_history: List[Dict[str, str]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500
+    ) -> str:
+        """
+        Generate a response given a draft of the expected output
+        
+        Providers with speculative decoding against a predicted output accept
+        the matching parts of the draft in bulk, which cuts latency for highly
+        templated responses. Clients without that support ignore the draft.
+        """
+        return await self.generate_response(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            chat_history=chat_history,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+    
+    async def stream_response(
+        self, 
+        system_prompt: SystemPrompt, 
+        user_message: str, 
+        chat_history: List[Dict[str, str]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        """
+        Yield the response text in chunks as it is generated
+        
+        Callers may stop iterating early (and should aclose() the iterator) once
+        they have what they need. Clients without streaming yield one chunk.
+        """
+        yield await self.generate_response(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            chat_history=chat_history,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
 
 
 class OpenAIClient(AIClient):
@@ -36,14 +217,49 @@ class OpenAIClient(AIClient):
     """
     
     def __init__(self, api_key: str, model: str = "gpt-4.1-nano"):
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.api_key = api_key
+        self._client: Optional[AsyncOpenAI] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client_closer: Optional[AsyncIterator[None]] = None
         self.model = model
         self.max_retries = 3
         self.retry_delay = 2.0
+        # Cleared once the model rejects predicted outputs
+        self.predictions_supported = True
+    
+    @property
+    def client(self) -> AsyncOpenAI:
+        """
+        SDK client with its own connection pool, created lazily per event loop
+        
+        Keep-alive connections are bound to the loop that opened them, so a new
+        loop (e.g. a second asyncio.run) gets a fresh client and pool. Each
+        client is closed when its loop shuts down, or by aclose().
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if self._client is None or (loop is not None and loop is not self._client_loop):
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=_make_http_client())
+            self._client_loop = loop
+            # Dropping the previous closer lets a still-running loop close its client
+            self._client_closer = _bind_to_running_loop(self._client) if loop is not None else None
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the current SDK client and its connection pool"""
+        client, closer = self._client, self._client_closer
+        self._client = self._client_loop = self._client_closer = None
+        if closer is not None:
+            await closer.aclose()
+        elif client is not None:
+            await client.close()
     
     async def generate_response(
         self, 
-        system_prompt: str, 
+        system_prompt: SystemPrompt, 
         user_message: str, 
         chat_history: List[Dict[str, str]] = None,
         temperature: float = 0.7,
@@ -55,15 +271,21 @@ class OpenAIClient(AIClient):
         Includes retry logic and error handling similar to WiddlePupper's implementation.
         """
         
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add chat history if provided
-        if chat_history:
-            for message in chat_history[-10:]:  # Limit to last 10 messages
-                messages.append(message)
-        
-        # Add current user message
-        messages.append({"role": "user", "content": user_message})
+        messages = self._build_messages(system_prompt, user_message, chat_history)
+        return await self._create_with_retries(messages, temperature, max_tokens)
+    
+    async def _create_with_retries(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        prediction: Optional[str] = None
+    ) -> str:
+        """Send one chat completion, retrying rate limits and API errors with backoff"""
+        extra = {}
+        if prediction is not None:
+            # Sent as a raw body field so older SDK versions pass it through
+            extra["extra_body"] = {"prediction": {"type": "content", "content": prediction}}
         
         for attempt in range(self.max_retries):
             try:
@@ -71,11 +293,22 @@ class OpenAIClient(AIClient):
                     model=self.model,
                     messages=messages,
                     temperature=temperature,
-                    max_tokens=max_tokens
+                    max_tokens=max_tokens,
+                    **extra
                 )
                 
                 return response.choices[0].message.content
                 
+            except openai.BadRequestError as e:
+                # A rejected prediction fails the same way every time; the
+                # caller resends without it
+                if prediction is not None and _rejects_prediction(e):
+                    raise
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self.retry_delay)
+                    continue
+                raise
+            
             except openai.RateLimitError:
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(self.retry_delay * (attempt + 1))
@@ -95,6 +328,103 @@ class OpenAIClient(AIClient):
                 raise
         
         raise Exception("Max retries exceeded")
+    
+    async def generate_predicted_response(
+        self,
+        system_prompt: SystemPrompt,
+        user_message: str,
+        prediction: str,
+        chat_history: List[Dict[str, str]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500
+    ) -> str:
+        """
+        Generate a response using OpenAI Predicted Outputs
+        
+        The request gets the same retries as generate_response. If the model
+        rejects the prediction parameter, the request is resent without it and
+        predictions are not sent again.
+        """
+        messages = self._build_messages(system_prompt, user_message, chat_history)
+        if not self.predictions_supported:
+            return await self._create_with_retries(messages, temperature, max_tokens)
+        
+        try:
+            return await self._create_with_retries(messages, temperature, max_tokens, prediction)
+        except openai.BadRequestError as e:
+            # Only a rejection of the prediction itself disables predictions
+            if not _rejects_prediction(e):
+                raise
+            self.predictions_supported = False
+            return await self._create_with_retries(messages, temperature, max_tokens)
+    
+    async def stream_response(
+        self, 
+        system_prompt: SystemPrompt, 
+        user_message: str, 
+        chat_history: List[Dict[str, str]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        """
+        Stream response text from the OpenAI API
+        
+        Only opening the stream is retried; once text has been yielded an error
+        is raised to the caller.
+        """
+        
+        messages = self._build_messages(system_prompt, user_message, chat_history)
+        
+        for attempt in range(self.max_retries):
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True
+                )
+                break
+                
+            except openai.RateLimitError:
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    continue
+                raise
+            
+            except Exception:
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self.retry_delay)
+                    continue
+                raise
+        
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Stop generation server-side when the caller exits early
+            await stream.close()
+    
+    def _build_messages(
+        self,
+        system_prompt: SystemPrompt,
+        user_message: str,
+        chat_history: Optional[List[Dict[str, str]]]
+    ) -> List[Dict[str, str]]:
+        """Assemble the chat messages for a request"""
+        
+        # OpenAI caches repeated prompt prefixes automatically, so blocks are just joined
+        messages = [{"role": "system", "content": flatten_system_prompt(system_prompt)}]
+        
+        # Add chat history if provided
+        if chat_history:
+            for message in chat_history[-10:]:  # Limit to last 10 messages
+                messages.append(message)
+        
+        # Add current user message
+        messages.append({"role": "user", "content": user_message})
+        return messages
 
 
 class MockAIClient(AIClient):
@@ -190,7 +520,7 @@ class MockAIClient(AIClient):
     
     async def generate_response(
         self, 
-        system_prompt: str, 
+        system_prompt: SystemPrompt, 
         user_message: str, 
         chat_history: List[Dict[str, str]] = None,
         temperature: float = 0.7,
@@ -199,6 +529,7 @@ class MockAIClient(AIClient):
         """Enhanced mock responses with species awareness and contextual understanding"""
         
         self.call_count += 1
+        system_prompt = flatten_system_prompt(system_prompt)
         
         # Extract species from system prompt
         species = self._extract_species_from_prompt(system_prompt)
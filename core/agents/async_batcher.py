@@ -0,0 +1,98 @@
+"""
+Async Batcher - Coalesces concurrent requests into batched calls
+
+Agents running for many creatures at once each await their own LLM round trip.
+The batcher collects requests that arrive within a short window and hands them
+to a single flush function, resolving each caller's future with its own result.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class AsyncBatcher:
+    """
+    Collects submitted items and flushes them together
+
+    A batch is flushed when it reaches max_batch items or when max_latency_ms
+    has passed since its first item arrived, whichever comes first. While no
+    flush is in flight there is nothing to wait behind, so the batch is instead
+    flushed on the next loop iteration: items submitted in the same iteration
+    (e.g. one asyncio.gather) still share it, and a lone caller adds no
+    latency. The flush
+    function receives the list of items and must return one result per item;
+    a result that is an Exception is raised to that item's caller.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 16,
+        max_latency_ms: float = 20
+    ):
+        self.flush_fn = flush_fn
+        self.max_batch = max_batch
+        self.max_latency = max_latency_ms / 1000.0
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Handle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Strong references to running flushes; the loop only holds them weakly
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending items and the timer belong to a previous event loop that
+            # will never run them; start afresh on this one
+            if self._timer is not None:
+                self._timer.cancel()
+            self._pending = []
+            self._timer = None
+            self._flushes = set()
+            self._loop = loop
+        
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._schedule_flush()
+        elif self._timer is None:
+            if self._flushes:
+                self._timer = loop.call_later(self.max_latency, self._schedule_flush)
+            else:
+                self._timer = loop.call_soon(self._schedule_flush)
+
+        return await future
+
+    def _schedule_flush(self) -> None:
+        """Detach the pending batch and flush it in its own task"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the flush function and hand each caller its result"""
+        try:
+            results = await self.flush_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch flush returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -77,10 +77,10 @@ class CreatureMindSystem:
         
         try:
             # Update creature's interaction time
-            self.creature.update_interaction_time()
+            now = self.creature.tick()
             
             # Create current state snapshot
-            current_state = CreatureState.from_creature(self.creature)
+            current_state = CreatureState.from_creature(self.creature, now)
             
             # Store user message in chat history
             user_message = {"role": "user", "content": user_input}
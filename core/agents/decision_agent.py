@@ -64,11 +64,9 @@ class DecisionAgent:
             # Get trait vector
             trait_vector = enhanced_personality.get_trait_vector()
             
-            # Compute utilities for different action styles
-            utilities = self.utility_model.compute_utilities(trait_vector, context_vector)
-            
-            # Select action style based on personality
-            action_style = self.utility_model.select_action_style(utilities)
+            # Compute utilities for different action styles and select one
+            # based on personality
+            action_style, utilities = self.utility_model.choose_action_style(trait_vector, context_vector)
         
         # Build system prompt (enhanced with trait information)
         system_prompt = self._build_enhanced_system_prompt(
@@ -113,11 +111,6 @@ class DecisionAgent:
     def _build_system_prompt(self, creature_state: CreatureState, template: CreatureTemplate) -> str:
         """Build the system prompt for decision making"""
         
-        # Get current stats
-        stats_summary = []
-        for stat_name, value in creature_state.stats.items():
-            stats_summary.append(f"- {stat_name.title()}: {value}/100")
-        
         # Get available behaviors from template
         behaviors = template.language.behavioral_patterns
         behavior_summary = "\n".join([f"- {behavior}" for behavior in behaviors])
@@ -131,7 +124,7 @@ Creature Profile:
 - Current mood: {creature_state.mood}
 
 Current State:
-{chr(10).join(stats_summary)}
+{creature_state.stats_summary()}
 
 Species-Specific Behaviors:
 {behavior_summary}
@@ -281,11 +274,6 @@ CURRENT STATE:
         if speech_style_data:
             speech_style_section = self._format_speech_style_prompt(speech_style_data)
         
-        # Get current stats
-        stats_summary = []
-        for stat_name, value in creature_state.stats.items():
-            stats_summary.append(f"- {stat_name.title()}: {value}/100")
-        
         system_prompt = f"""You are the Decision Making Agent for a {creature_state.species}.
 
 ENHANCED TRAIT-DRIVEN PERSONALITY:
@@ -308,7 +296,7 @@ Creature Profile:
 - Current mood: {creature_state.mood}
 
 Current State:
-{chr(10).join(stats_summary)}
+{creature_state.stats_summary()}
 
 Species-Specific Behaviors:
 {chr(10).join([f"- {behavior}" for behavior in template.language.behavioral_patterns])}
@@ -62,10 +62,6 @@ class EmotionAgent:
     def _build_system_prompt(self, creature_state: CreatureState, template: CreatureTemplate) -> str:
         """Build the system prompt for emotion analysis"""
         
-        stats_summary = []
-        for stat_name, value in creature_state.stats.items():
-            stats_summary.append(f"- {stat_name.title()}: {value}/100")
-        
         system_prompt = f"""You are the Emotion Agent for a {creature_state.species}.
 
 Creature Profile:
@@ -75,7 +71,7 @@ Creature Profile:
 - Current mood: {creature_state.mood}
 
 Current State:
-{chr(10).join(stats_summary)}
+{creature_state.stats_summary()}
 
 {template.emotion_prompt_additions}
 
@@ -9,6 +9,26 @@ from ..models.creature import CreatureState
 from .ai_client import AIClient
 
 
+# Per-turn context template, filled with str.format_map in _format_context_data
+_CTX_TEMPLATE = """Current Interaction Context:
+User Input: {current_input}
+
+Perception Analysis:
+- User Tone: {user_tone}
+- User Intent: {user_intent}
+- Creature's Initial Reaction: {creature_reaction}
+
+Emotional Response:
+- Primary Emotion: {primary_emotion}
+- Can Translate: {can_translate}
+- Emotional Impact: {impact_score}
+
+Current Creature State:
+- Mood: {mood}
+- Hours since last interaction: {last_interaction_hours:.1f}
+- Personality traits: {traits}"""
+
+
 class MemoryAgent:
     """
     Analyzes creature's memories to provide relevant context for responses
@@ -115,23 +135,18 @@ CONTEXT_IMPACT: (how memories and conversation history affect interpretation of
     ) -> str:
         """Format the current context for memory analysis"""
         
-        return f"""Current Interaction Context:
-User Input: {current_input}
-
-Perception Analysis:
-- User Tone: {perception_data.get('user_tone', 'unknown')}
-- User Intent: {perception_data.get('user_intent', 'unknown')}
-- Creature's Initial Reaction: {perception_data.get('creature_reaction', 'neutral')}
-
-Emotional Response:
-- Primary Emotion: {emotion_data.get('primary_emotion', 'neutral')}
-- Can Translate: {emotion_data.get('can_translate', False)}
-- Emotional Impact: {emotion_data.get('impact_score', 0.0)}
-
-Current Creature State:
-- Mood: {creature_state.mood}
-- Hours since last interaction: {creature_state.last_interaction_hours:.1f}
-- Personality traits: {', '.join(creature_state.personality_traits)}"""
+        return _CTX_TEMPLATE.format_map({
+            "current_input": current_input,
+            "user_tone": perception_data.get('user_tone', 'unknown'),
+            "user_intent": perception_data.get('user_intent', 'unknown'),
+            "creature_reaction": perception_data.get('creature_reaction', 'neutral'),
+            "primary_emotion": emotion_data.get('primary_emotion', 'neutral'),
+            "can_translate": emotion_data.get('can_translate', False),
+            "impact_score": emotion_data.get('impact_score', 0.0),
+            "mood": creature_state.mood,
+            "last_interaction_hours": creature_state.last_interaction_hours,
+            "traits": ', '.join(creature_state.personality_traits),
+        })
     
     def _parse_memory_response(self, response: str) -> Dict[str, Any]:
         """Parse the AI response into structured memory data"""
@@ -4,10 +4,127 @@ Perception Agent - Analyzes user input and current context
 Adapted from the perception logic in WiddlePupper's AIAgentSystem.swift
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
 from ..models.creature import CreatureState
 from ..models.creature_template import CreatureTemplate
-from .ai_client import AIClient
+from .ai_client import AIClient, flatten_system_prompt
+from .async_batcher import AsyncBatcher
+
+# Optional: paraphrase-level response cache
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# One "KEY: value" line of the perception response format
+_FIELD_RE = re.compile(
+    r"^[ \t]*(USER_TONE|USER_INTENT|INTENT_DETAILS|RELEVANCE_TO_NEEDS|"
+    r"CREATURE_REACTION|ATTENTION_FOCUS|LIKELY_RESPONSE_TYPE)[ \t]*:(.*)$",
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Values used for fields the response leaves out
+_DEFAULTS = {
+    "user_tone": "neutral",
+    "user_intent": "unknown",
+    "intent_details": "",
+    "relevance_to_needs": "",
+    "creature_reaction": "neutral",
+    "attention_focus": "",
+    "likely_response_type": "neutral"
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _static_block(species: str, perception_prompt_additions: str) -> str:
+    """Per-template part of the perception system prompt"""
+    return f"""You are a Perception Agent analyzing user input for a {species}.
+
+{perception_prompt_additions}
+
+Important analysis guidelines:
+1. Analyze the emotional tone of the message (friendly, commanding, playful, worried, etc.)
+2. Determine the user's likely intention (greet, request_activity, express_concern, command, etc.)
+3. Evaluate how this relates to the creature's current physical/emotional needs
+4. Consider how this creature type's traits affect perception
+5. Consider the context of recent interactions
+
+Response format:
+USER_TONE: (emotional tone of user message)
+USER_INTENT: (what the user appears to want)
+INTENT_DETAILS: (specific details about the intent, if any)
+RELEVANCE_TO_NEEDS: (how this relates to current needs/state)
+CREATURE_REACTION: (how this creature type would initially react)
+ATTENTION_FOCUS: (what aspect the creature finds most interesting/concerning)
+LIKELY_RESPONSE_TYPE: (excited|cautious|confused|eager|tired|hungry|playful|defensive)"""
+
+
+# Returned when the provider call fails (plus an "error" entry)
+_FALLBACK_PERCEPTION = {
+    "user_tone": "unknown",
+    "user_intent": "unknown",
+    "intent_details": "",
+    "relevance_to_needs": "unknown",
+    "creature_reaction": "neutral",
+    "attention_focus": "user_presence",
+    "likely_response_type": "cautious"
+}
+
+# Per-call creature state part of the perception system prompt
+_STATE_TEMPLATE = """Creature Profile:
+- Species: {species}
+- Template: {template_name}
+- Personality traits: {traits}
+- Current mood: {mood}
+
+Current State:
+{stats}
+
+Recent memories: {memories}
+Last interaction: {hours:.1f} hours ago"""
+
+# Inputs whose perception is fixed, answered without an LLM call
+_GREETING = {
+    "user_tone": "friendly",
+    "user_intent": "greet",
+    "intent_details": "",
+    "relevance_to_needs": "social contact with the user",
+    "creature_reaction": "happy to see the user",
+    "attention_focus": "user_presence",
+    "likely_response_type": "excited"
+}
+_PRAISE = {
+    "user_tone": "affectionate",
+    "user_intent": "praise",
+    "intent_details": "",
+    "relevance_to_needs": "affection and approval from the user",
+    "creature_reaction": "pleased by the praise",
+    "attention_focus": "user_presence",
+    "likely_response_type": "eager"
+}
+_TRIVIAL = {
+    "hi": _GREETING,
+    "hello": _GREETING,
+    "hey": _GREETING,
+    "hi there": _GREETING,
+    "hello there": _GREETING,
+    "good morning": _GREETING,
+    "good boy": _PRAISE,
+    "good girl": _PRAISE,
+}
 
 
 class PerceptionAgent:
@@ -21,8 +138,67 @@ class PerceptionAgent:
     - Contextual factors that might influence the response
     """
     
+    __slots__ = (
+        "ai_client", "stats", "_exact_cache", "_sem_cache", "_batcher", "_hit_counts",
+        "_ltm_pending", "_ltm_timer", "_ltm_timer_loop",
+        "_failures", "_cooldown", "_circuit_open_until"
+    )
+    
+    # Exact-match response cache limits
+    CACHE_MAX_SIZE = 1024
+    CACHE_TTL_SECONDS = 600.0
+    
+    # Semantic cache settings (only active when sentence-transformers is installed)
+    EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+    SEMANTIC_THRESHOLD = 0.92
+    SEMANTIC_BUCKET_SIZE = 256
+    EMBEDDING_SCALE = 127.0  # int8 quantization of cached embeddings
+    
+    # Circuit breaker: after this many consecutive failures, skip the provider
+    # for a cooldown that doubles on each repeat trip (up to the max)
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_COOLDOWN_SECONDS = 30.0
+    CIRCUIT_MAX_COOLDOWN_SECONDS = 300.0
+    
+    # Persistent tier: entries hit this often survive restarts. Promotions are
+    # written off the event loop in batches of up to LTM_FLUSH_ENTRIES, at most
+    # LTM_FLUSH_SECONDS after they are queued.
+    LTM_PROMOTE_HITS = 3
+    LTM_WARM_ENTRIES = 256
+    LTM_FLUSH_ENTRIES = 32
+    LTM_FLUSH_SECONDS = 5.0
+    
+    # Shared across agents; None = not loaded yet, False = unavailable
+    _embedder = None
+    _ltm = None
+    _ltm_lock = threading.Lock()
+    
     def __init__(self, ai_client: AIClient):
         self.ai_client = ai_client
+        
+        # sha256(prompt, message, temperature) -> (stored_at, perception_data)
+        self._exact_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "semantic_hits": 0}
+        
+        # (species, mood, coarse stats) -> [(int8 embedding, perception_data, cache key)]
+        self._sem_cache: Dict[Tuple, List[Tuple[np.ndarray, Dict[str, Any], str]]] = {}
+        
+        # cache key -> hits, for promotion to the persistent tier
+        self._hit_counts: Dict[str, int] = {}
+        
+        # cache key -> persistent-tier row waiting for the next batched write
+        self._ltm_pending: Dict[str, Tuple] = {}
+        self._ltm_timer: Optional[asyncio.TimerHandle] = None
+        self._ltm_timer_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Concurrent analyze() calls (e.g. many creatures per tick) share one dispatch
+        self._batcher = AsyncBatcher(self._dispatch_batch, max_batch=16, max_latency_ms=20)
+        
+        self._failures = 0
+        self._cooldown = self.CIRCUIT_COOLDOWN_SECONDS
+        self._circuit_open_until = 0.0
+        
+        self._load_ltm()
     
     async def analyze(
         self, 
@@ -37,120 +213,368 @@ class PerceptionAgent:
         Adapted from WiddlePupper's perception agent prompt logic.
         """
         
-        # Build the system prompt for perception analysis
-        system_prompt = self._build_system_prompt(creature_state, template)
+        # Plain greetings and praise read the same whatever the creature's state;
+        # the emotion and decision agents still react to that state downstream
+        if not context:
+            trivial = _TRIVIAL.get(user_input.strip().lower().rstrip("!. "))
+            if trivial is not None:
+                return dict(trivial)
+        
+        # Build the system prompt for perception analysis: the per-template
+        # instructions come first so providers can cache them as a prefix
+        static_prefix, dynamic_suffix = self._build_system_prompt(creature_state, template)
+        system_prompt = [
+            {"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": dynamic_suffix},
+        ]
         
-        # Add any additional context
+        # Add any additional context; sorted keys keep equal dicts byte-identical
         context_info = ""
         if context:
-            context_info = f"\nAdditional context: {context}"
+            context_info = "\nAdditional context: " + json.dumps(
+                context, sort_keys=True, separators=(",", ":"), default=str
+            )
         
         user_message = f"{user_input}{context_info}"
+        # Perception is classification, so it runs deterministically; this also
+        # makes repeat inputs hit the exact-match cache. Later agents keep their
+        # own temperatures for creative flavor.
+        temperature = 0.0
+        
+        cache_key = self._cache_key(flatten_system_prompt(system_prompt), user_message, temperature)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Paraphrases of earlier input in the same coarse state reuse that result.
+        # Extra context can change the reading, so only plain input is matched.
+        # The embedding only runs on an exact-cache miss, in a worker thread.
+        embedding = None
+        bucket_key = None
+        if not context and self._embedder is not False:
+            embedding = await asyncio.to_thread(self._embed, user_input)
+            if embedding is not None:
+                bucket_key = self._semantic_bucket(creature_state)
+                similar = self._semantic_get(bucket_key, embedding)
+                if similar is not None:
+                    return similar
+        
+        # Provider kept failing: answer with the fallback until the cooldown ends
+        if time.monotonic() < self._circuit_open_until:
+            return {**_FALLBACK_PERCEPTION, "error": "AI service unavailable, retrying later"}
         
         try:
-            response = await self.ai_client.generate_response(
-                system_prompt=system_prompt,
-                user_message=user_message,
-                temperature=0.7
-            )
+            perception_data = await self._batcher.submit({
+                "system_prompt": system_prompt,
+                "user_message": user_message,
+                "temperature": temperature,
+                "max_tokens": 200  # seven short fields
+            })
             
-            return self._parse_perception_response(response)
+            self._failures = 0
+            self._cooldown = self.CIRCUIT_COOLDOWN_SECONDS
+            self._cache_put(cache_key, perception_data)
+            if embedding is not None:
+                self._semantic_put(bucket_key, embedding, perception_data, cache_key)
+            return perception_data
             
         except Exception as e:
             # Fallback response if AI call fails
-            return {
-                "user_tone": "unknown",
-                "user_intent": "unknown", 
-                "intent_details": "",
-                "relevance_to_needs": "unknown",
-                "creature_reaction": "neutral",
-                "attention_focus": "user_presence",
-                "likely_response_type": "cautious",
-                "error": str(e)
-            }
-    
-    def _build_system_prompt(self, creature_state: CreatureState, template: CreatureTemplate) -> str:
-        """Build the system prompt for perception analysis"""
-        
-        # Get creature's current stats summary
-        stats_summary = []
-        for stat_name, value in creature_state.stats.items():
-            stats_summary.append(f"- {stat_name.title()}: {value}/100")
+            self._record_failure()
+            return {**_FALLBACK_PERCEPTION, "error": str(e)}
+    
+    def _record_failure(self) -> None:
+        """Count a failed provider call and open the circuit when failures pile up"""
+        self._failures += 1
+        if self._failures >= self.CIRCUIT_FAILURE_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + self._cooldown
+            self._cooldown = min(self._cooldown * 2, self.CIRCUIT_MAX_COOLDOWN_SECONDS)
+            self._failures = 0
+    
+    async def _dispatch_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Flush function for the batcher: stream each request concurrently"""
+        return await asyncio.gather(
+            *(self._stream_perception(request) for request in requests),
+            return_exceptions=True
+        )
+    
+    async def _stream_perception(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse perception fields line by line as the response streams in
+        
+        Stops reading as soon as all fields have been seen, so trailing text
+        the model adds after the format is never generated in full.
+        """
+        perception_data = dict(_DEFAULTS)
+        field_count = len(perception_data)
+        match_field = _FIELD_RE.match
+        seen = set()
+        buffer = ""
+        
+        stream = self.ai_client.stream_response(**request)
+        try:
+            async for chunk in stream:
+                buffer += chunk
+                *lines, buffer = buffer.split("\n")
+                for line in lines:
+                    match = match_field(line)
+                    if match:
+                        key = match.group(1).lower()
+                        perception_data[key] = match.group(2).strip()
+                        seen.add(key)
+                if len(seen) == field_count:
+                    return perception_data
+        finally:
+            await stream.aclose()
+        
+        # Final line without a trailing newline
+        match = _FIELD_RE.match(buffer)
+        if match:
+            perception_data[match.group(1).lower()] = match.group(2).strip()
+        return perception_data
+    
+    @staticmethod
+    def _cache_key(system_prompt: str, user_message: str, temperature: float) -> str:
+        """Stable hash of everything that determines the LLM response"""
+        payload = json.dumps(
+            {"sys": system_prompt, "usr": user_message, "t": temperature},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a live cache entry, or None on miss/expiry"""
+        entry = self._exact_cache.get(key)
+        if entry is not None:
+            stored_at, perception_data = entry
+            if time.monotonic() - stored_at < self.CACHE_TTL_SECONDS:
+                self._exact_cache.move_to_end(key)
+                self.stats["hits"] += 1
+                self._record_hit(key, perception_data)
+                return dict(perception_data)
+            del self._exact_cache[key]
+        
+        self.stats["misses"] += 1
+        return None
+    
+    def _cache_put(self, key: str, perception_data: Dict[str, Any]) -> None:
+        """Store a parsed response, evicting the least recently used entry"""
+        self._exact_cache[key] = (time.monotonic(), dict(perception_data))
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > self.CACHE_MAX_SIZE:
+            evicted_key, _ = self._exact_cache.popitem(last=False)
+            self._hit_counts.pop(evicted_key, None)
+    
+    @classmethod
+    def _embed(cls, text: str) -> Optional[np.ndarray]:
+        """Unit-normalized sentence embedding, or None if no embedder is available"""
+        if cls._embedder is None:
+            try:
+                cls._embedder = SentenceTransformer(cls.EMBEDDING_MODEL) if SentenceTransformer else False
+            except Exception:
+                cls._embedder = False
+        
+        if cls._embedder is False:
+            return None
+        
+        try:
+            return np.asarray(
+                cls._embedder.encode(text, normalize_embeddings=True), dtype=np.float32
+            )
+        except Exception:
+            return None
+    
+    @classmethod
+    def _quantize(cls, embedding: np.ndarray) -> np.ndarray:
+        """int8 copy of a unit embedding (components lie in [-1, 1])"""
+        return np.clip(np.rint(embedding * cls.EMBEDDING_SCALE), -127, 127).astype(np.int8)
+    
+    @staticmethod
+    def _semantic_bucket(creature_state: CreatureState) -> Tuple:
+        """Coarse state key: perception is only shared between similar states"""
+        return (
+            creature_state.species,
+            creature_state.mood,
+            tuple(int(value // 25) for value in creature_state.stats.values())
+        )
+    
+    def _semantic_get(self, bucket_key: Tuple, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Return a copy of the closest cached result above the similarity threshold"""
+        bucket = self._sem_cache.get(bucket_key)
+        if not bucket:
+            return None
+        
+        matrix = np.stack([entry[0] for entry in bucket]).astype(np.int32)
+        similarities = (matrix @ self._quantize(embedding).astype(np.int32)) / self.EMBEDDING_SCALE ** 2
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.SEMANTIC_THRESHOLD:
+            return None
+        
+        # Refresh recency so popular phrasings survive eviction
+        entry = bucket.pop(best)
+        bucket.append(entry)
+        self.stats["semantic_hits"] += 1
+        vector, perception_data, key = entry
+        self._record_hit(key, perception_data, bucket_key, vector)
+        return dict(perception_data)
+    
+    def _semantic_put(
+        self,
+        bucket_key: Tuple,
+        embedding: np.ndarray,
+        perception_data: Dict[str, Any],
+        key: str
+    ) -> None:
+        """Remember a result for its embedding, dropping the oldest entry when full"""
+        bucket = self._sem_cache.setdefault(bucket_key, [])
+        bucket.append((self._quantize(embedding), dict(perception_data), key))
+        if len(bucket) > self.SEMANTIC_BUCKET_SIZE:
+            bucket.pop(0)
+    
+    @classmethod
+    def _ltm_connection(cls, create: bool = False) -> Optional[sqlite3.Connection]:
+        """
+        Open the shared on-disk cache, or None if it cannot be used
+        
+        Without create, a store that does not exist yet is left uncreated, so
+        constructing an agent never writes to disk; the first promotion does.
+        """
+        if cls._ltm is None:
+            cache_dir = os.getenv("CREATUREMIND_CACHE_DIR", ".creaturemind")
+            path = os.path.join(cache_dir, "perception_ltm.db")
+            if not create and not os.path.exists(path):
+                return None
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                conn = sqlite3.connect(path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS perception_ltm ("
+                    "key TEXT PRIMARY KEY, bucket TEXT, embedding BLOB, "
+                    "perception TEXT NOT NULL, freq INTEGER NOT NULL, last_used REAL NOT NULL)"
+                )
+                conn.commit()
+                cls._ltm = conn
+            except (OSError, sqlite3.Error):
+                cls._ltm = False
+        
+        return cls._ltm or None
+    
+    def _load_ltm(self) -> None:
+        """Warm the in-memory caches with the most frequently hit persisted entries"""
+        with self._ltm_lock:
+            conn = self._ltm_connection()
+            if conn is None:
+                return
+            
+            try:
+                rows = conn.execute(
+                    "SELECT key, bucket, embedding, perception, freq FROM perception_ltm "
+                    "ORDER BY freq DESC LIMIT ?",
+                    (self.LTM_WARM_ENTRIES,)
+                ).fetchall()
+            except sqlite3.Error:
+                return
+        
+        # Least frequent first, so the most popular end up most recently used
+        for key, bucket, embedding, perception, freq in reversed(rows):
+            perception_data = json.loads(perception)
+            self._cache_put(key, perception_data)
+            self._hit_counts[key] = freq
+            if bucket is not None and embedding is not None:
+                species, mood, stat_bins = json.loads(bucket)
+                self._sem_cache.setdefault((species, mood, tuple(stat_bins)), []).append(
+                    (np.frombuffer(embedding, dtype=np.int8), perception_data, key)
+                )
+    
+    def _record_hit(
+        self,
+        key: str,
+        perception_data: Dict[str, Any],
+        bucket_key: Optional[Tuple] = None,
+        vector: Optional[np.ndarray] = None
+    ) -> None:
+        """Count a cache hit and queue entries for persistence once they are hit often enough"""
+        hits = self._hit_counts.get(key, 0) + 1
+        self._hit_counts[key] = hits
+        if hits < self.LTM_PROMOTE_HITS or self._ltm is False:
+            return
+        
+        self._ltm_pending[key] = (
+            key,
+            json.dumps(bucket_key) if bucket_key is not None else None,
+            vector.tobytes() if vector is not None else None,
+            json.dumps(perception_data),
+            hits,
+            time.time()
+        )
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Written by the next flush from inside an event loop
+        
+        if len(self._ltm_pending) >= self.LTM_FLUSH_ENTRIES:
+            self._flush_ltm()
+        elif self._ltm_timer is None or self._ltm_timer_loop is not loop:
+            # A timer left by a previous event loop will never fire
+            self._ltm_timer = loop.call_later(self.LTM_FLUSH_SECONDS, self._flush_ltm)
+            self._ltm_timer_loop = loop
+    
+    def _flush_ltm(self) -> None:
+        """Hand the queued promotions to a worker thread for one batched upsert"""
+        if self._ltm_timer is not None:
+            self._ltm_timer.cancel()
+            self._ltm_timer = None
+        
+        rows, self._ltm_pending = list(self._ltm_pending.values()), {}
+        if rows:
+            asyncio.get_running_loop().run_in_executor(None, self._write_ltm, rows)
+    
+    @classmethod
+    def _write_ltm(cls, rows: List[Tuple]) -> None:
+        """Upsert promoted entries into the on-disk cache (runs in a worker thread)"""
+        with cls._ltm_lock:
+            conn = cls._ltm_connection(create=True)
+            if conn is None:
+                return
+            
+            try:
+                conn.executemany(
+                    "INSERT INTO perception_ltm (key, bucket, embedding, perception, freq, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET freq = excluded.freq, last_used = excluded.last_used, "
+                    "bucket = COALESCE(excluded.bucket, bucket), embedding = COALESCE(excluded.embedding, embedding)",
+                    rows
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+    
+    def _build_system_prompt(self, creature_state: CreatureState, template: CreatureTemplate) -> Tuple[str, str]:
+        """
+        Build the system prompt for perception analysis
+        
+        Returns (static_prefix, dynamic_suffix). The prefix only depends on the
+        template; the suffix carries the creature's current state.
+        """
         
         # Get recent memories summary
         memory_summary = "No recent memories"
-        if creature_state.recent_memories:
-            recent = creature_state.recent_memories[:3]
-            memory_summary = "; ".join([m.description for m in recent])
+        recent_memories = creature_state.recent_memories
+        if recent_memories:
+            memory_summary = "; ".join(m.description for m in recent_memories[:3])
         
-        system_prompt = f"""You are a Perception Agent analyzing user input for a {creature_state.species}.
-
-Creature Profile:
-- Species: {creature_state.species}
-- Template: {template.name}
-- Personality traits: {', '.join(creature_state.personality_traits)}
-- Current mood: {creature_state.mood}
-
-Current State:
-{chr(10).join(stats_summary)}
-
-Recent memories: {memory_summary}
-Last interaction: {creature_state.last_interaction_hours:.1f} hours ago
-
-{template.perception_prompt_additions}
-
-Important analysis guidelines:
-1. Analyze the emotional tone of the message (friendly, commanding, playful, worried, etc.)
-2. Determine the user's likely intention (greet, request_activity, express_concern, command, etc.)
-3. Evaluate how this relates to the creature's current physical/emotional needs
-4. Consider how this creature type's traits affect perception
-5. Consider the context of recent interactions
-
-Response format:
-USER_TONE: (emotional tone of user message)
-USER_INTENT: (what the user appears to want)
-INTENT_DETAILS: (specific details about the intent, if any)
-RELEVANCE_TO_NEEDS: (how this relates to current needs/state)
-CREATURE_REACTION: (how this creature type would initially react)
-ATTENTION_FOCUS: (what aspect the creature finds most interesting/concerning)
-LIKELY_RESPONSE_TYPE: (excited|cautious|confused|eager|tired|hungry|playful|defensive)"""
-
-        return system_prompt
-    
-    def _parse_perception_response(self, response: str) -> Dict[str, Any]:
-        """Parse the AI response into structured data"""
-        
-        perception_data = {
-            "user_tone": "neutral",
-            "user_intent": "unknown",
-            "intent_details": "",
-            "relevance_to_needs": "",
-            "creature_reaction": "neutral", 
-            "attention_focus": "",
-            "likely_response_type": "neutral"
-        }
-        
-        # Parse the response line by line
-        lines = response.strip().split('\n')
-        for line in lines:
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip().lower().replace('_', '_')
-                value = value.strip()
-                
-                if key == "user_tone":
-                    perception_data["user_tone"] = value
-                elif key == "user_intent":
-                    perception_data["user_intent"] = value
-                elif key == "intent_details":
-                    perception_data["intent_details"] = value
-                elif key == "relevance_to_needs":
-                    perception_data["relevance_to_needs"] = value
-                elif key == "creature_reaction":
-                    perception_data["creature_reaction"] = value
-                elif key == "attention_focus":
-                    perception_data["attention_focus"] = value
-                elif key == "likely_response_type":
-                    perception_data["likely_response_type"] = value
-        
-        return perception_data
\ No newline at end of file
+        static_prefix = _static_block(template.species, template.perception_prompt_additions)
+        
+        dynamic_suffix = _STATE_TEMPLATE.format_map({
+            "species": creature_state.species,
+            "template_name": template.name,
+            "traits": ', '.join(creature_state.personality_traits),
+            "mood": creature_state.mood,
+            "stats": creature_state.stats_summary(),
+            "memories": memory_summary,
+            "hours": creature_state.last_interaction_hours,
+        })
+        
+        return static_prefix, dynamic_suffix
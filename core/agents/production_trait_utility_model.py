@@ -7,12 +7,118 @@ for mapping 50-dimensional personality traits to action preferences.
 Based on established psychological correlations between personality traits and behavioral tendencies.
 """
 
+from bisect import bisect_right
+import functools
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple, Union
 from pydantic import BaseModel
 import json
 import os
+import re
 from ..models.personality_system import TRAIT_NAME_TO_INDEX
+from .trait_utility_model import _weight_file_paths
+from .utility_kernels import NUMBA_AVAILABLE, compute_and_sample, score_and_softmax
+
+
+# Intent keyword tables, matched against the words of the perceived user intent
+_SOCIAL_KW = frozenset({'play', 'talk', 'interact', 'social', 'together', 'friend'})
+_CARE_KW = frozenset({'care', 'help', 'comfort', 'love', 'pet', 'gentle', 'safe'})
+_PLAY_KW = frozenset({'play', 'fun', 'game', 'toy', 'fetch', 'run', 'energy'})
+_COMMAND_KW = frozenset({'sit', 'stay', 'come', 'stop', 'do', 'should', 'must', 'command'})
+_COMPLEXITY_KW = frozenset({'complex', 'difficult', 'many', 'multiple', 'problem', 'solve'})
+_PROBLEM_KW = frozenset({'problem', 'solve', 'figure', 'how', 'why', 'what', 'find'})
+_LEARNING_KW = frozenset({'learn', 'teach', 'show', 'new', 'try', 'practice'})
+_CREATIVE_KW = frozenset({'create', 'make', 'invent', 'imagine', 'art', 'creative', 'new'})
+_URGENT_KW = frozenset({'quick', 'fast', 'hurry', 'urgent', 'now', 'immediate'})
+
+# (keywords, matches for a full score) for the intent-driven context dimensions,
+# in order: social, care, play, command (5-8), complexity (15), problem solving (17),
+# learning (18), creative potential (19), time pressure (20)
+_INTENT_CATEGORIES: Tuple[Tuple[FrozenSet[str], float], ...] = (
+    (_SOCIAL_KW, 3.0),
+    (_CARE_KW, 3.0),
+    (_PLAY_KW, 3.0),
+    (_COMMAND_KW, 3.0),
+    (_COMPLEXITY_KW, 2.0),
+    (_PROBLEM_KW, 3.0),
+    (_LEARNING_KW, 3.0),
+    (_CREATIVE_KW, 3.0),
+    (_URGENT_KW, 2.0),
+)
+
+_WORD_RE = re.compile(r"[a-z']+")
+_E_DROPPING_SUFFIXES = ("ing", "ion", "ed")
+
+
+def _intent_tokens(perception_data: Dict[str, Any]) -> FrozenSet[str]:
+    """
+    Lower-cased words of the perceived user intent, plus every prefix of at
+    least three letters, so a keyword matches any word it starts ("playtime",
+    "running", "petting"). Words that dropped a final 'e' before -ing/-ion/-ed
+    also yield the restored stem ("caring" -> "care", "creation" -> "create").
+    """
+    tokens = set()
+    for word in _WORD_RE.findall(perception_data.get('user_intent', '').lower()):
+        tokens.add(word)
+        tokens.update(word[:n] for n in range(3, len(word)))
+        for suffix in _E_DROPPING_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                tokens.add(word[:-len(suffix)] + "e")
+    return frozenset(tokens)
+
+
+# Context dimension mapping (from ContextVector class)
+_CONTEXT_INDEX = {
+    "emotional_intensity": 0, "emotional_valence": 1, "emotional_stability": 2,
+    "user_mood": 3, "creature_mood": 4, "user_intent_social": 5,
+    "user_intent_care": 6, "user_intent_play": 7, "user_intent_command": 8,
+    "relationship_quality": 9, "energy_level": 10, "physical_needs": 11,
+    "comfort_level": 12, "safety_level": 13, "environment_familiarity": 14,
+    "complexity_level": 15, "novelty_level": 16, "problem_solving_needed": 17,
+    "learning_opportunity": 18, "creative_potential": 19, "time_pressure": 20,
+    "routine_vs_special": 21, "recent_activity_level": 22, "fatigue_level": 23,
+    "anticipation_level": 24
+}
+
+def _compile_weight_specs(
+    table: Dict[str, Dict[str, Dict[str, float]]]
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Resolve the name-keyed weight table into index arrays once
+
+    Returns action -> (row_idx, row_delta, trait_idx, context_idx, value). Row
+    additions are applied first and cell values are then assigned; each cell
+    value already includes any row additions listed after it in the table, so
+    the result matches applying the entries one by one in order.
+    """
+    specs = {}
+    for action, trait_weights in table.items():
+        rows, deltas, cells, values = [], [], [], []
+        for trait_name, context_weights in trait_weights.items():
+            if trait_name not in TRAIT_NAME_TO_INDEX:
+                continue
+            trait_idx = TRAIT_NAME_TO_INDEX[trait_name]
+            for context_name, weight in context_weights.items():
+                if context_name in _CONTEXT_INDEX:
+                    cells.append((trait_idx, _CONTEXT_INDEX[context_name]))
+                    values.append(weight)
+                elif context_name in TRAIT_NAME_TO_INDEX:
+                    # Trait-trait relationships nudge the whole row
+                    delta = weight * 0.1
+                    rows.append(trait_idx)
+                    deltas.append(delta)
+                    for i, (cell_row, _) in enumerate(cells):
+                        if cell_row == trait_idx:
+                            values[i] += delta
+        
+        specs[action] = (
+            np.array(rows, dtype=np.intp),
+            np.array(deltas),
+            np.array([cell[0] for cell in cells], dtype=np.intp),
+            np.array([cell[1] for cell in cells], dtype=np.intp),
+            np.array(values)
+        )
+    return specs
 
 
 class ContextVector:
@@ -20,69 +126,99 @@ class ContextVector:
     Encodes situational context into a 25-dimensional vector for utility computation
     """
     
-    def __init__(self):
-        self.vector = np.zeros(25)
+    __slots__ = ('vector',)
+    
+    # Lookup tables shared by the feature extractors
+    _POSITIVE_EMOTIONS = frozenset({'happy', 'excited', 'content', 'joyful', 'playful', 'love'})
+    _NEGATIVE_EMOTIONS = frozenset({'sad', 'angry', 'fear', 'anxious', 'frustrated', 'lonely'})
+    _ANTICIPATION_EMOTIONS = frozenset({'excited', 'curious', 'eager', 'anticipation'})
+    _POSITIVE_TONES = frozenset({'happy', 'excited', 'playful', 'affectionate', 'encouraging'})
+    _NEGATIVE_TONES = frozenset({'angry', 'sad', 'frustrated', 'worried', 'stern'})
+    _SOOTHING_TONES = frozenset({'gentle', 'calm', 'soothing'})
+    _HARSH_TONES = frozenset({'loud', 'aggressive', 'harsh'})
+    _THREATENING_TONES = frozenset({'threatening', 'angry', 'aggressive'})
+    _REASSURING_TONES = frozenset({'gentle', 'calm', 'reassuring'})
+    _MOOD_MAP = {
+        'joyful': 0.9, 'content': 0.7, 'neutral': 0.5,
+        'tired': 0.3, 'unhappy': 0.1
+    }
+    _QUALITY_MAP = {
+        'strong_bond': 0.9, 'good': 0.7, 'neutral': 0.5,
+        'strained': 0.3, 'poor': 0.1
+    }
+    # Hours-since-interaction bucket edges and the activity level for each bucket
+    _ACTIVITY_HOURS = (1, 6)
+    _ACTIVITY_LEVELS = (0.8, 0.5, 0.2)
+    
+    def __init__(self, vector: Optional[np.ndarray] = None):
+        self.vector = np.zeros(25, dtype=np.float32) if vector is None else vector
     
     @classmethod
     def from_agent_data(cls, perception_data: Dict[str, Any], emotion_data: Dict[str, Any], 
                        memory_data: Dict[str, Any], creature_state) -> "ContextVector":
         """Create context vector from agent analysis data"""
-        context = cls()
-        
-        # Emotional dimensions (0-4)
-        context.vector[0] = cls._normalize_emotional_intensity(emotion_data)
-        context.vector[1] = cls._normalize_emotional_valence(emotion_data)
-        context.vector[2] = cls._normalize_emotional_stability(creature_state)
-        context.vector[3] = cls._normalize_user_mood(perception_data)
-        context.vector[4] = cls._normalize_creature_mood(creature_state)
-        
-        # Intent dimensions (5-8)
-        context.vector[5] = cls._extract_social_intent(perception_data)
-        context.vector[6] = cls._extract_care_intent(perception_data)
-        context.vector[7] = cls._extract_play_intent(perception_data)
-        context.vector[8] = cls._extract_command_intent(perception_data)
-        
-        # Relationship & state (9-14)
-        context.vector[9] = cls._assess_relationship_quality(memory_data)
-        context.vector[10] = cls._normalize_energy_level(creature_state)
-        context.vector[11] = cls._assess_physical_needs(creature_state)
-        context.vector[12] = cls._assess_comfort_level(creature_state, perception_data)
-        context.vector[13] = cls._assess_safety_level(perception_data)
-        context.vector[14] = cls._assess_environment_familiarity(memory_data)
-        
-        # Cognitive & task dimensions (15-19)
-        context.vector[15] = cls._assess_complexity_level(perception_data)
-        context.vector[16] = cls._assess_novelty_level(perception_data, memory_data)
-        context.vector[17] = cls._assess_problem_solving_needed(perception_data)
-        context.vector[18] = cls._assess_learning_opportunity(perception_data)
-        context.vector[19] = cls._assess_creative_potential(perception_data)
-        
-        # Temporal & activity (20-24)
-        context.vector[20] = cls._assess_time_pressure(perception_data)
-        context.vector[21] = cls._assess_routine_vs_special(memory_data)
-        context.vector[22] = cls._assess_recent_activity_level(creature_state)
-        context.vector[23] = cls._assess_fatigue_level(creature_state)
-        context.vector[24] = cls._assess_anticipation_level(emotion_data)
+        # Every keyword-driven dimension from one tokenization of the intent
+        intent_tokens = _intent_tokens(perception_data)
+        (social_intent, care_intent, play_intent, command_intent, complexity,
+         problem_solving, learning, creative, time_pressure) = (
+            min(1.0, len(intent_tokens & keywords) / divisor)
+            for keywords, divisor in _INTENT_CATEGORIES
+        )
+        
+        # All 25 dimensions are computed first and packed into one array
+        values = (
+            # Emotional dimensions (0-4)
+            cls._normalize_emotional_intensity(emotion_data),
+            cls._normalize_emotional_valence(emotion_data),
+            cls._normalize_emotional_stability(creature_state),
+            cls._normalize_user_mood(perception_data),
+            cls._normalize_creature_mood(creature_state),
+            
+            # Intent dimensions (5-8)
+            social_intent,
+            care_intent,
+            play_intent,
+            command_intent,
+            
+            # Relationship & state (9-14)
+            cls._assess_relationship_quality(memory_data),
+            cls._normalize_energy_level(creature_state),
+            cls._assess_physical_needs(creature_state),
+            cls._assess_comfort_level(creature_state, perception_data),
+            cls._assess_safety_level(perception_data),
+            cls._assess_environment_familiarity(memory_data),
+            
+            # Cognitive & task dimensions (15-19)
+            complexity,
+            cls._assess_novelty_level(perception_data, memory_data),
+            problem_solving,
+            learning,
+            creative,
+            
+            # Temporal & activity (20-24)
+            time_pressure,
+            cls._assess_routine_vs_special(memory_data),
+            cls._assess_recent_activity_level(creature_state),
+            cls._assess_fatigue_level(creature_state),
+            cls._assess_anticipation_level(emotion_data)
+        )
         
-        return context
+        return cls(np.asarray(values, dtype=np.float32))
     
     @staticmethod
     def _normalize_emotional_intensity(emotion_data: Dict[str, Any]) -> float:
         """Extract emotional intensity (0.0-1.0)"""
         impact = emotion_data.get('impact_score', 0.0)
-        return np.clip(abs(impact), 0.0, 1.0)
+        return min(1.0, abs(impact))
     
-    @staticmethod
-    def _normalize_emotional_valence(emotion_data: Dict[str, Any]) -> float:
+    @classmethod
+    def _normalize_emotional_valence(cls, emotion_data: Dict[str, Any]) -> float:
         """Extract emotional valence: 0.0=very negative, 0.5=neutral, 1.0=very positive"""
         primary_emotion = emotion_data.get('primary_emotion', 'neutral')
         
-        positive_emotions = {'happy', 'excited', 'content', 'joyful', 'playful', 'love'}
-        negative_emotions = {'sad', 'angry', 'fear', 'anxious', 'frustrated', 'lonely'}
-        
-        if primary_emotion in positive_emotions:
+        if primary_emotion in cls._POSITIVE_EMOTIONS:
             return 0.7 + 0.3 * emotion_data.get('impact_score', 0.0)
-        elif primary_emotion in negative_emotions:
+        elif primary_emotion in cls._NEGATIVE_EMOTIONS:
             return 0.3 - 0.3 * emotion_data.get('impact_score', 0.0)
         else:
             return 0.5
@@ -94,79 +230,27 @@ class ContextVector:
         energy = creature_state.stats.get('energy', 50) / 100.0
         return (happiness + energy) / 2.0
     
-    @staticmethod
-    def _normalize_user_mood(perception_data: Dict[str, Any]) -> float:
+    @classmethod
+    def _normalize_user_mood(cls, perception_data: Dict[str, Any]) -> float:
         """Extract user mood from perception analysis"""
         user_tone = perception_data.get('user_tone', 'neutral')
         
-        positive_tones = {'happy', 'excited', 'playful', 'affectionate', 'encouraging'}
-        negative_tones = {'angry', 'sad', 'frustrated', 'worried', 'stern'}
-        
-        if user_tone in positive_tones:
+        if user_tone in cls._POSITIVE_TONES:
             return 0.8
-        elif user_tone in negative_tones:
+        elif user_tone in cls._NEGATIVE_TONES:
             return 0.2
         else:
             return 0.5
     
-    @staticmethod
-    def _normalize_creature_mood(creature_state) -> float:
+    @classmethod
+    def _normalize_creature_mood(cls, creature_state) -> float:
         """Normalize creature mood to 0.0-1.0"""
-        mood_map = {
-            'joyful': 0.9, 'content': 0.7, 'neutral': 0.5,
-            'tired': 0.3, 'unhappy': 0.1
-        }
-        return mood_map.get(creature_state.mood, 0.5)
+        return cls._MOOD_MAP.get(creature_state.mood, 0.5)
     
-    @staticmethod
-    def _extract_social_intent(perception_data: Dict[str, Any]) -> float:
-        """Extract social interaction intent"""
-        user_intent = perception_data.get('user_intent', '')
-        social_keywords = ['play', 'talk', 'interact', 'social', 'together', 'friend']
-        
-        intent_lower = user_intent.lower()
-        social_score = sum(1 for keyword in social_keywords if keyword in intent_lower)
-        return min(1.0, social_score / 3.0)
-    
-    @staticmethod
-    def _extract_care_intent(perception_data: Dict[str, Any]) -> float:
-        """Extract caring/nurturing intent"""
-        user_intent = perception_data.get('user_intent', '')
-        care_keywords = ['care', 'help', 'comfort', 'love', 'pet', 'gentle', 'safe']
-        
-        intent_lower = user_intent.lower()
-        care_score = sum(1 for keyword in care_keywords if keyword in intent_lower)
-        return min(1.0, care_score / 3.0)
-    
-    @staticmethod
-    def _extract_play_intent(perception_data: Dict[str, Any]) -> float:
-        """Extract playful intent"""
-        user_intent = perception_data.get('user_intent', '')
-        play_keywords = ['play', 'fun', 'game', 'toy', 'fetch', 'run', 'energy']
-        
-        intent_lower = user_intent.lower()
-        play_score = sum(1 for keyword in play_keywords if keyword in intent_lower)
-        return min(1.0, play_score / 3.0)
-    
-    @staticmethod
-    def _extract_command_intent(perception_data: Dict[str, Any]) -> float:
-        """Extract command/directive intent"""
-        user_intent = perception_data.get('user_intent', '')
-        command_keywords = ['sit', 'stay', 'come', 'stop', 'do', 'should', 'must', 'command']
-        
-        intent_lower = user_intent.lower()
-        command_score = sum(1 for keyword in command_keywords if keyword in intent_lower)
-        return min(1.0, command_score / 3.0)
-    
-    @staticmethod
-    def _assess_relationship_quality(memory_data: Dict[str, Any]) -> float:
+    @classmethod
+    def _assess_relationship_quality(cls, memory_data: Dict[str, Any]) -> float:
         """Assess relationship quality from memory"""
-        relationship = memory_data.get('relationship', 'neutral')
-        quality_map = {
-            'strong_bond': 0.9, 'good': 0.7, 'neutral': 0.5,
-            'strained': 0.3, 'poor': 0.1
-        }
-        return quality_map.get(relationship, 0.5)
+        return cls._QUALITY_MAP.get(memory_data.get('relationship', 'neutral'), 0.5)
     
     @staticmethod
     def _normalize_energy_level(creature_state) -> float:
@@ -181,28 +265,28 @@ class ContextVector:
         avg_stats = sum(creature_state.stats.get(stat, 50) for stat in relevant_stats) / len(relevant_stats)
         return 1.0 - (avg_stats / 100.0)  # Invert so higher = more needs
     
-    @staticmethod
-    def _assess_comfort_level(creature_state, perception_data: Dict[str, Any]) -> float:
+    @classmethod
+    def _assess_comfort_level(cls, creature_state, perception_data: Dict[str, Any]) -> float:
         """Assess creature's comfort level"""
         happiness = creature_state.stats.get('happiness', 50) / 100.0
         user_tone = perception_data.get('user_tone', 'neutral')
         
         comfort_adjustment = 0.0
-        if user_tone in ['gentle', 'calm', 'soothing']:
+        if user_tone in cls._SOOTHING_TONES:
             comfort_adjustment = 0.2
-        elif user_tone in ['loud', 'aggressive', 'harsh']:
+        elif user_tone in cls._HARSH_TONES:
             comfort_adjustment = -0.2
         
-        return np.clip(happiness + comfort_adjustment, 0.0, 1.0)
+        return min(1.0, max(0.0, happiness + comfort_adjustment))
     
-    @staticmethod
-    def _assess_safety_level(perception_data: Dict[str, Any]) -> float:
+    @classmethod
+    def _assess_safety_level(cls, perception_data: Dict[str, Any]) -> float:
         """Assess perceived safety level"""
         user_tone = perception_data.get('user_tone', 'neutral')
         
-        if user_tone in ['threatening', 'angry', 'aggressive']:
+        if user_tone in cls._THREATENING_TONES:
             return 0.2
-        elif user_tone in ['gentle', 'calm', 'reassuring']:
+        elif user_tone in cls._REASSURING_TONES:
             return 0.9
         else:
             return 0.7  # Default to feeling relatively safe
@@ -218,16 +302,6 @@ class ContextVector:
         else:
             return 0.9  # Very familiar
     
-    @staticmethod
-    def _assess_complexity_level(perception_data: Dict[str, Any]) -> float:
-        """Assess complexity of the situation"""
-        user_intent = perception_data.get('user_intent', '')
-        complex_keywords = ['complex', 'difficult', 'many', 'multiple', 'problem', 'solve']
-        
-        intent_lower = user_intent.lower()
-        complexity_score = sum(1 for keyword in complex_keywords if keyword in intent_lower)
-        return min(1.0, complexity_score / 2.0)
-    
     @staticmethod
     def _assess_novelty_level(perception_data: Dict[str, Any], memory_data: Dict[str, Any]) -> float:
         """Assess novelty of the situation"""
@@ -239,46 +313,6 @@ class ContextVector:
         else:
             return 0.1  # Not novel
     
-    @staticmethod
-    def _assess_problem_solving_needed(perception_data: Dict[str, Any]) -> float:
-        """Assess if problem-solving is needed"""
-        user_intent = perception_data.get('user_intent', '')
-        problem_keywords = ['problem', 'solve', 'figure', 'how', 'why', 'what', 'find']
-        
-        intent_lower = user_intent.lower()
-        problem_score = sum(1 for keyword in problem_keywords if keyword in intent_lower)
-        return min(1.0, problem_score / 3.0)
-    
-    @staticmethod
-    def _assess_learning_opportunity(perception_data: Dict[str, Any]) -> float:
-        """Assess learning opportunity"""
-        user_intent = perception_data.get('user_intent', '')
-        learning_keywords = ['learn', 'teach', 'show', 'new', 'try', 'practice']
-        
-        intent_lower = user_intent.lower()
-        learning_score = sum(1 for keyword in learning_keywords if keyword in intent_lower)
-        return min(1.0, learning_score / 3.0)
-    
-    @staticmethod
-    def _assess_creative_potential(perception_data: Dict[str, Any]) -> float:
-        """Assess creative potential of situation"""
-        user_intent = perception_data.get('user_intent', '')
-        creative_keywords = ['create', 'make', 'invent', 'imagine', 'art', 'creative', 'new']
-        
-        intent_lower = user_intent.lower()
-        creative_score = sum(1 for keyword in creative_keywords if keyword in intent_lower)
-        return min(1.0, creative_score / 3.0)
-    
-    @staticmethod
-    def _assess_time_pressure(perception_data: Dict[str, Any]) -> float:
-        """Assess time pressure in situation"""
-        user_intent = perception_data.get('user_intent', '')
-        urgent_keywords = ['quick', 'fast', 'hurry', 'urgent', 'now', 'immediate']
-        
-        intent_lower = user_intent.lower()
-        urgency_score = sum(1 for keyword in urgent_keywords if keyword in intent_lower)
-        return min(1.0, urgency_score / 2.0)
-    
     @staticmethod
     def _assess_routine_vs_special(memory_data: Dict[str, Any]) -> float:
         """Assess if situation is routine (0.0) or special (1.0)"""
@@ -290,15 +324,11 @@ class ContextVector:
         else:
             return 0.5  # Somewhat special
     
-    @staticmethod
-    def _assess_recent_activity_level(creature_state) -> float:
+    @classmethod
+    def _assess_recent_activity_level(cls, creature_state) -> float:
         """Assess recent activity level"""
-        if creature_state.last_interaction_hours < 1:
-            return 0.8  # Recent activity
-        elif creature_state.last_interaction_hours < 6:
-            return 0.5  # Moderate activity
-        else:
-            return 0.2  # Low recent activity
+        # Under 1 hour: recent, under 6 hours: moderate, otherwise low
+        return cls._ACTIVITY_LEVELS[bisect_right(cls._ACTIVITY_HOURS, creature_state.last_interaction_hours)]
     
     @staticmethod
     def _assess_fatigue_level(creature_state) -> float:
@@ -307,20 +337,21 @@ class ContextVector:
         # Higher fatigue = lower energy
         return 1.0 - (energy / 100.0)
     
-    @staticmethod
-    def _assess_anticipation_level(emotion_data: Dict[str, Any]) -> float:
+    @classmethod
+    def _assess_anticipation_level(cls, emotion_data: Dict[str, Any]) -> float:
         """Assess anticipation/excitement level"""
         primary_emotion = emotion_data.get('primary_emotion', 'neutral')
-        anticipation_emotions = {'excited', 'curious', 'eager', 'anticipation'}
         
-        if primary_emotion in anticipation_emotions:
+        if primary_emotion in cls._ANTICIPATION_EMOTIONS:
             return 0.8
         else:
             return 0.3
     
     def to_numpy(self) -> np.ndarray:
-        """Convert to numpy array for utility computation"""
-        return self.vector.copy()
+        """Convert to numpy array for utility computation (a read-only view)"""
+        view = self.vector.view()
+        view.flags.writeable = False
+        return view
 
 
 class ProductionTraitUtilityModel:
@@ -392,262 +423,262 @@ class ProductionTraitUtilityModel:
         }
     }
     
+    # Scientifically-grounded trait-action relationships: action -> trait -> {context: weight}.
+    # A context name that is itself a trait adds weight * 0.1 across that trait's whole row.
+    _ACTION_WEIGHT_TABLE: Dict[str, Dict[str, Dict[str, float]]] = {
+        "playful": {
+            "extraversion": {
+                "user_intent_play": 0.8, "emotional_valence": 0.7, 
+                "energy_level": 0.6, "user_intent_social": 0.5
+            },
+            "openness": {
+                "novelty_level": 0.7, "creative_potential": 0.6,
+                "learning_opportunity": 0.5, "routine_vs_special": 0.4
+            },
+            "enthusiasm": {
+                "emotional_intensity": 0.6, "anticipation_level": 0.5,
+                "user_intent_play": 0.7, "energy_level": 0.4
+            },
+            "sociability": {
+                "user_intent_social": 0.8, "relationship_quality": 0.6,
+                "user_intent_play": 0.5
+            }
+        },
+        "cautious": {
+            "conscientiousness": {
+                "complexity_level": 0.7, "safety_level": 0.6,
+                "time_pressure": 0.5, "problem_solving_needed": 0.4
+            },
+            "caution": {
+                "safety_level": 0.9, "novelty_level": -0.6,
+                "environment_familiarity": -0.5, "risk_taking": -0.7
+            },
+            "neuroticism": {
+                "emotional_stability": -0.6, "safety_level": 0.5,
+                "comfort_level": 0.4, "relationship_quality": 0.3
+            }
+        },
+        "assertive": {
+            "assertiveness": {
+                "user_intent_command": 0.8, "complexity_level": 0.6,
+                "relationship_quality": 0.4, "emotional_intensity": 0.3
+            },
+            "confidence": {
+                "user_intent_command": 0.7, "problem_solving_needed": 0.6,
+                "emotional_valence": 0.5, "energy_level": 0.4
+            },
+            "decisiveness": {
+                "time_pressure": 0.8, "complexity_level": 0.6,
+                "problem_solving_needed": 0.7, "user_intent_command": 0.5
+            },
+            "boldness": {
+                "novelty_level": 0.6, "creative_potential": 0.5,
+                "routine_vs_special": 0.4, "anticipation_level": 0.3
+            }
+        },
+        "nurturing": {
+            "agreeableness": {
+                "user_intent_care": 0.9, "emotional_valence": 0.6,
+                "relationship_quality": 0.7, "user_intent_social": 0.5
+            },
+            "empathy": {
+                "emotional_intensity": 0.8, "user_mood": 0.7,
+                "creature_mood": 0.6, "user_intent_care": 0.8
+            },
+            "altruism": {
+                "user_intent_care": 0.8, "physical_needs": 0.6,
+                "comfort_level": 0.5, "emotional_valence": 0.4
+            },
+            "emotional_expressiveness": {
+                "emotional_intensity": 0.6, "user_mood": 0.5,
+                "relationship_quality": 0.4, "user_intent_social": 0.3
+            }
+        },
+        "curious": {
+            "curiosity": {
+                "novelty_level": 0.9, "learning_opportunity": 0.8,
+                "complexity_level": 0.6, "creative_potential": 0.7
+            },
+            "openness": {
+                "novelty_level": 0.8, "creative_potential": 0.7,
+                "learning_opportunity": 0.6, "routine_vs_special": 0.5
+            },
+            "curiosity_intellectual": {
+                "complexity_level": 0.8, "problem_solving_needed": 0.7,
+                "learning_opportunity": 0.9, "novelty_level": 0.6
+            },
+            "innovativeness": {
+                "creative_potential": 0.8, "novelty_level": 0.6,
+                "problem_solving_needed": 0.5, "routine_vs_special": 0.4
+            }
+        },
+        "defensive": {
+            "neuroticism": {
+                "safety_level": 0.7, "emotional_stability": -0.6,
+                "comfort_level": 0.5, "environment_familiarity": 0.4
+            },
+            "caution": {
+                "safety_level": 0.9, "novelty_level": -0.5,
+                "environment_familiarity": -0.4, "time_pressure": 0.3
+            },
+            "independence": {
+                "user_intent_social": -0.5, "relationship_quality": -0.3,
+                "user_intent_command": -0.4, "safety_level": 0.4
+            },
+            "trust": {
+                "relationship_quality": -0.6, "safety_level": -0.4,
+                "environment_familiarity": -0.3, "user_intent_social": -0.5
+            }
+        },
+        "social": {
+            "extraversion": {
+                "user_intent_social": 0.9, "relationship_quality": 0.7,
+                "emotional_valence": 0.6, "user_intent_play": 0.5
+            },
+            "sociability": {
+                "user_intent_social": 0.9, "relationship_quality": 0.8,
+                "user_intent_play": 0.6, "emotional_intensity": 0.4
+            },
+            "agreeableness": {
+                "relationship_quality": 0.8, "user_intent_social": 0.7,
+                "emotional_valence": 0.5, "user_intent_care": 0.4
+            },
+            "collaboration": {
+                "user_intent_social": 0.7, "relationship_quality": 0.6,
+                "problem_solving_needed": 0.5, "complexity_level": 0.4
+            }
+        },
+        "independent": {
+            "independence": {
+                "user_intent_social": -0.6, "user_intent_command": -0.4,
+                "relationship_quality": -0.3, "complexity_level": 0.5
+            },
+            "self_efficacy": {
+                "problem_solving_needed": 0.7, "complexity_level": 0.6,
+                "confidence": 0.5, "energy_level": 0.4
+            },
+            "confidence": {
+                "problem_solving_needed": 0.6, "energy_level": 0.5,
+                "emotional_valence": 0.4, "decisiveness": 0.6
+            },
+            "assertiveness": {
+                "user_intent_command": 0.5, "independence": 0.4,
+                "emotional_intensity": 0.3, "relationship_quality": 0.2
+            }
+        },
+        "analytical": {
+            "systematic_thinking": {
+                "problem_solving_needed": 0.9, "complexity_level": 0.8,
+                "learning_opportunity": 0.6, "time_pressure": -0.3
+            },
+            "conscientiousness": {
+                "complexity_level": 0.7, "problem_solving_needed": 0.6,
+                "time_pressure": 0.5, "detail_orientation": 0.8
+            },
+            "focus": {
+                "complexity_level": 0.8, "problem_solving_needed": 0.7,
+                "time_pressure": 0.4, "fatigue_level": -0.5
+            },
+            "reflectiveness": {
+                "complexity_level": 0.6, "problem_solving_needed": 0.5,
+                "time_pressure": -0.4, "learning_opportunity": 0.4
+            }
+        },
+        "emotional": {
+            "emotional_expressiveness": {
+                "emotional_intensity": 0.9, "user_mood": 0.7,
+                "creature_mood": 0.8, "relationship_quality": 0.5
+            },
+            "empathy": {
+                "emotional_intensity": 0.8, "user_mood": 0.8,
+                "creature_mood": 0.7, "user_intent_care": 0.6
+            },
+            "neuroticism": {
+                "emotional_intensity": 0.6, "emotional_stability": -0.5,
+                "comfort_level": 0.4, "safety_level": 0.3
+            },
+            "self_awareness": {
+                "emotional_intensity": 0.5, "creature_mood": 0.6,
+                "relationship_quality": 0.4, "mindfulness": 0.7
+            }
+        }
+    }
+    
+    # The table resolved to index arrays once, at class creation
+    _ACTION_WEIGHT_SPECS = _compile_weight_specs(_ACTION_WEIGHT_TABLE)
+    
+    # Maximum number of distinct trait vectors whose projections are cached
+    TRAIT_CACHE_SIZE = 256
+    
     def __init__(self, trait_dim: int = 50, context_dim: int = 25):
         self.trait_dim = trait_dim
         self.context_dim = context_dim
         self.actions = list(self.ACTION_STYLES.keys())
         
-        # Production-ready weight matrices based on psychological research
-        self.W = self._build_production_weight_matrices()
+        # Production-ready weight matrices based on psychological research,
+        # stored as one contiguous (actions, traits, contexts) tensor that is
+        # built once and shared read-only by every instance
+        self._set_weight_tensor(self._build_production_weight_matrices(trait_dim, context_dim))
         self.b = self._build_production_biases()
         
         # Temperature for action selection (tuned for balanced selection)
         self.temperature = 0.4
+        
+        # Constant uniform context used for personality analysis
+        neutral_context = np.full(context_dim, 0.5, dtype=np.float32)
+        self._neutral_context = ContextVector(neutral_context / np.linalg.norm(neutral_context))
     
-    def _build_production_weight_matrices(self) -> Dict[str, np.ndarray]:
-        """Build scientifically-grounded weight matrices"""
-        W = {}
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_production_weight_matrices(cls, trait_dim: int, context_dim: int) -> np.ndarray:
+        """Build scientifically-grounded weight matrices as a read-only (A, T, C) tensor"""
+        # Only the researched connections carry signal; everything else stays zero
+        W = np.zeros((len(cls.ACTION_STYLES), trait_dim, context_dim), dtype=np.float32)
         
-        for action in self.actions:
-            # Initialize with small random noise for non-specified connections
-            W[action] = np.random.randn(self.trait_dim, self.context_dim) * 0.05
-            
+        for i, action in enumerate(cls.ACTION_STYLES):
             # Apply researched trait-context-action relationships
-            self._apply_psychological_weights(W[action], action)
+            cls._apply_psychological_weights(W[i], action)
         
+        W.setflags(write=False)
         return W
     
-    def _apply_psychological_weights(self, weight_matrix: np.ndarray, action: str) -> None:
+    def _set_weight_tensor(self, W_tensor: np.ndarray) -> None:
+        """Install the weight tensor along with the action name -> row index map"""
+        self.W_tensor = W_tensor
+        self.action_to_idx = {action: i for i, action in enumerate(self.actions)}
+        # Name-keyed views into W_tensor, kept for weight export
+        self.W = {action: W_tensor[i] for action, i in self.action_to_idx.items()}
+        # Projections computed against the previous weights are no longer valid
+        self._trait_cache: Dict[bytes, np.ndarray] = {}
+    
+    def _trait_projection(self, trait_vector: np.ndarray) -> np.ndarray:
+        """P^T * W_a for every action as an (A, C) matrix, cached per trait vector"""
+        trait_vector = np.ascontiguousarray(trait_vector)
+        key = trait_vector.tobytes()
+        projection = self._trait_cache.get(key)
+        if projection is None:
+            if len(self._trait_cache) >= self.TRAIT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._trait_cache[next(iter(self._trait_cache))]
+            projection = trait_vector @ self.W_tensor
+            self._trait_cache[key] = projection
+        return projection
+    
+    @property
+    def b(self) -> Dict[str, float]:
+        """Biases by action name; a snapshot of b_vec, so assign to change it"""
+        return dict(zip(self.actions, self.b_vec.tolist()))
+    
+    @b.setter
+    def b(self, biases: Dict[str, float]) -> None:
+        self.b_vec = np.array([biases[action] for action in self.actions], dtype=np.float32)
+    
+    @classmethod
+    def _apply_psychological_weights(cls, weight_matrix: np.ndarray, action: str) -> None:
         """Apply psychologically-grounded weights based on research"""
-        
-        action_config = self.ACTION_STYLES[action]
-        primary_traits = action_config["primary_traits"]
-        
-        # Context dimension mapping (from ContextVector class)
-        context_map = {
-            "emotional_intensity": 0, "emotional_valence": 1, "emotional_stability": 2,
-            "user_mood": 3, "creature_mood": 4, "user_intent_social": 5,
-            "user_intent_care": 6, "user_intent_play": 7, "user_intent_command": 8,
-            "relationship_quality": 9, "energy_level": 10, "physical_needs": 11,
-            "comfort_level": 12, "safety_level": 13, "environment_familiarity": 14,
-            "complexity_level": 15, "novelty_level": 16, "problem_solving_needed": 17,
-            "learning_opportunity": 18, "creative_potential": 19, "time_pressure": 20,
-            "routine_vs_special": 21, "recent_activity_level": 22, "fatigue_level": 23,
-            "anticipation_level": 24
-        }
-        
-        # Scientifically-grounded trait-action relationships
-        if action == "playful":
-            self._set_weights(weight_matrix, {
-                "extraversion": {
-                    "user_intent_play": 0.8, "emotional_valence": 0.7, 
-                    "energy_level": 0.6, "user_intent_social": 0.5
-                },
-                "openness": {
-                    "novelty_level": 0.7, "creative_potential": 0.6,
-                    "learning_opportunity": 0.5, "routine_vs_special": 0.4
-                },
-                "enthusiasm": {
-                    "emotional_intensity": 0.6, "anticipation_level": 0.5,
-                    "user_intent_play": 0.7, "energy_level": 0.4
-                },
-                "sociability": {
-                    "user_intent_social": 0.8, "relationship_quality": 0.6,
-                    "user_intent_play": 0.5
-                }
-            }, context_map)
-            
-        elif action == "cautious":
-            self._set_weights(weight_matrix, {
-                "conscientiousness": {
-                    "complexity_level": 0.7, "safety_level": 0.6,
-                    "time_pressure": 0.5, "problem_solving_needed": 0.4
-                },
-                "caution": {
-                    "safety_level": 0.9, "novelty_level": -0.6,
-                    "environment_familiarity": -0.5, "risk_taking": -0.7
-                },
-                "neuroticism": {
-                    "emotional_stability": -0.6, "safety_level": 0.5,
-                    "comfort_level": 0.4, "relationship_quality": 0.3
-                }
-            }, context_map)
-            
-        elif action == "assertive":
-            self._set_weights(weight_matrix, {
-                "assertiveness": {
-                    "user_intent_command": 0.8, "complexity_level": 0.6,
-                    "relationship_quality": 0.4, "emotional_intensity": 0.3
-                },
-                "confidence": {
-                    "user_intent_command": 0.7, "problem_solving_needed": 0.6,
-                    "emotional_valence": 0.5, "energy_level": 0.4
-                },
-                "decisiveness": {
-                    "time_pressure": 0.8, "complexity_level": 0.6,
-                    "problem_solving_needed": 0.7, "user_intent_command": 0.5
-                },
-                "boldness": {
-                    "novelty_level": 0.6, "creative_potential": 0.5,
-                    "routine_vs_special": 0.4, "anticipation_level": 0.3
-                }
-            }, context_map)
-            
-        elif action == "nurturing":
-            self._set_weights(weight_matrix, {
-                "agreeableness": {
-                    "user_intent_care": 0.9, "emotional_valence": 0.6,
-                    "relationship_quality": 0.7, "user_intent_social": 0.5
-                },
-                "empathy": {
-                    "emotional_intensity": 0.8, "user_mood": 0.7,
-                    "creature_mood": 0.6, "user_intent_care": 0.8
-                },
-                "altruism": {
-                    "user_intent_care": 0.8, "physical_needs": 0.6,
-                    "comfort_level": 0.5, "emotional_valence": 0.4
-                },
-                "emotional_expressiveness": {
-                    "emotional_intensity": 0.6, "user_mood": 0.5,
-                    "relationship_quality": 0.4, "user_intent_social": 0.3
-                }
-            }, context_map)
-            
-        elif action == "curious":
-            self._set_weights(weight_matrix, {
-                "curiosity": {
-                    "novelty_level": 0.9, "learning_opportunity": 0.8,
-                    "complexity_level": 0.6, "creative_potential": 0.7
-                },
-                "openness": {
-                    "novelty_level": 0.8, "creative_potential": 0.7,
-                    "learning_opportunity": 0.6, "routine_vs_special": 0.5
-                },
-                "curiosity_intellectual": {
-                    "complexity_level": 0.8, "problem_solving_needed": 0.7,
-                    "learning_opportunity": 0.9, "novelty_level": 0.6
-                },
-                "innovativeness": {
-                    "creative_potential": 0.8, "novelty_level": 0.6,
-                    "problem_solving_needed": 0.5, "routine_vs_special": 0.4
-                }
-            }, context_map)
-            
-        elif action == "defensive":
-            self._set_weights(weight_matrix, {
-                "neuroticism": {
-                    "safety_level": 0.7, "emotional_stability": -0.6,
-                    "comfort_level": 0.5, "environment_familiarity": 0.4
-                },
-                "caution": {
-                    "safety_level": 0.9, "novelty_level": -0.5,
-                    "environment_familiarity": -0.4, "time_pressure": 0.3
-                },
-                "independence": {
-                    "user_intent_social": -0.5, "relationship_quality": -0.3,
-                    "user_intent_command": -0.4, "safety_level": 0.4
-                },
-                "trust": {
-                    "relationship_quality": -0.6, "safety_level": -0.4,
-                    "environment_familiarity": -0.3, "user_intent_social": -0.5
-                }
-            }, context_map)
-            
-        elif action == "social":
-            self._set_weights(weight_matrix, {
-                "extraversion": {
-                    "user_intent_social": 0.9, "relationship_quality": 0.7,
-                    "emotional_valence": 0.6, "user_intent_play": 0.5
-                },
-                "sociability": {
-                    "user_intent_social": 0.9, "relationship_quality": 0.8,
-                    "user_intent_play": 0.6, "emotional_intensity": 0.4
-                },
-                "agreeableness": {
-                    "relationship_quality": 0.8, "user_intent_social": 0.7,
-                    "emotional_valence": 0.5, "user_intent_care": 0.4
-                },
-                "collaboration": {
-                    "user_intent_social": 0.7, "relationship_quality": 0.6,
-                    "problem_solving_needed": 0.5, "complexity_level": 0.4
-                }
-            }, context_map)
-            
-        elif action == "independent":
-            self._set_weights(weight_matrix, {
-                "independence": {
-                    "user_intent_social": -0.6, "user_intent_command": -0.4,
-                    "relationship_quality": -0.3, "complexity_level": 0.5
-                },
-                "self_efficacy": {
-                    "problem_solving_needed": 0.7, "complexity_level": 0.6,
-                    "confidence": 0.5, "energy_level": 0.4
-                },
-                "confidence": {
-                    "problem_solving_needed": 0.6, "energy_level": 0.5,
-                    "emotional_valence": 0.4, "decisiveness": 0.6
-                },
-                "assertiveness": {
-                    "user_intent_command": 0.5, "independence": 0.4,
-                    "emotional_intensity": 0.3, "relationship_quality": 0.2
-                }
-            }, context_map)
-            
-        elif action == "analytical":
-            self._set_weights(weight_matrix, {
-                "systematic_thinking": {
-                    "problem_solving_needed": 0.9, "complexity_level": 0.8,
-                    "learning_opportunity": 0.6, "time_pressure": -0.3
-                },
-                "conscientiousness": {
-                    "complexity_level": 0.7, "problem_solving_needed": 0.6,
-                    "time_pressure": 0.5, "detail_orientation": 0.8
-                },
-                "focus": {
-                    "complexity_level": 0.8, "problem_solving_needed": 0.7,
-                    "time_pressure": 0.4, "fatigue_level": -0.5
-                },
-                "reflectiveness": {
-                    "complexity_level": 0.6, "problem_solving_needed": 0.5,
-                    "time_pressure": -0.4, "learning_opportunity": 0.4
-                }
-            }, context_map)
-            
-        elif action == "emotional":
-            self._set_weights(weight_matrix, {
-                "emotional_expressiveness": {
-                    "emotional_intensity": 0.9, "user_mood": 0.7,
-                    "creature_mood": 0.8, "relationship_quality": 0.5
-                },
-                "empathy": {
-                    "emotional_intensity": 0.8, "user_mood": 0.8,
-                    "creature_mood": 0.7, "user_intent_care": 0.6
-                },
-                "neuroticism": {
-                    "emotional_intensity": 0.6, "emotional_stability": -0.5,
-                    "comfort_level": 0.4, "safety_level": 0.3
-                },
-                "self_awareness": {
-                    "emotional_intensity": 0.5, "creature_mood": 0.6,
-                    "relationship_quality": 0.4, "mindfulness": 0.7
-                }
-            }, context_map)
-    
-    def _set_weights(self, weight_matrix: np.ndarray, trait_context_weights: Dict[str, Dict[str, float]], 
-                     context_map: Dict[str, int]) -> None:
-        """Helper to set specific trait-context weights"""
-        for trait_name, context_weights in trait_context_weights.items():
-            if trait_name in TRAIT_NAME_TO_INDEX:
-                trait_idx = TRAIT_NAME_TO_INDEX[trait_name]
-                for context_name, weight in context_weights.items():
-                    if context_name in context_map:
-                        context_idx = context_map[context_name]
-                        weight_matrix[trait_idx, context_idx] = weight
-                    elif context_name in TRAIT_NAME_TO_INDEX:
-                        # Handle trait-trait relationships (for reference traits)
-                        ref_trait_idx = TRAIT_NAME_TO_INDEX[context_name]
-                        # Apply the weight across relevant contexts
-                        weight_matrix[trait_idx, :] += weight * 0.1
+        rows, deltas, trait_idx, context_idx, values = cls._ACTION_WEIGHT_SPECS[action]
+        np.add.at(weight_matrix, rows, deltas[:, None])
+        weight_matrix[trait_idx, context_idx] = values
     
     def _build_production_biases(self) -> Dict[str, float]:
         """Build production biases based on general action tendencies"""
@@ -666,38 +697,114 @@ class ProductionTraitUtilityModel:
     
     def compute_utilities(self, trait_vector: np.ndarray, context_vector: ContextVector) -> Dict[str, float]:
         """Compute utility scores for each action style"""
-        utilities = {}
+        return dict(zip(self.actions, self._compute_utilities_arr(trait_vector, context_vector).tolist()))
+    
+    def _compute_utilities_arr(self, trait_vector: np.ndarray, context_vector: ContextVector) -> np.ndarray:
+        """Utility scores as an array in self.actions order"""
         context_array = context_vector.to_numpy()
         
-        for action in self.actions:
-            # U(a|P,x) = P^T * W_a * x + b_a
-            utility = float(trait_vector.T @ self.W[action] @ context_array + self.b[action])
-            utilities[action] = utility
+        # U(a|P,x) = P^T * W_a * x + b_a for all actions. A creature's traits
+        # change far less often than its context, so P^T * W_a is cached and
+        # each call only needs an (A, C) x (C,) product
+        return self._trait_projection(trait_vector) @ context_array + self.b_vec
+    
+    def compute_utilities_batch(self, trait_matrix: np.ndarray, context_matrix: np.ndarray) -> np.ndarray:
+        """Compute utilities for B creatures at once from (B, T) traits and (B, C) contexts; returns (B, A)"""
+        trait_matrix = np.asarray(trait_matrix, dtype=np.float32)
+        context_matrix = np.asarray(context_matrix, dtype=np.float32)
         
-        return utilities
+        # Contract contexts first so the large (A, T, C) tensor is read once per batch
+        projected = np.einsum('atc,bc->bat', self.W_tensor, context_matrix)
+        return np.einsum('bat,bt->ba', projected, trait_matrix) + self.b_vec
     
-    def select_action_style(self, utilities: Dict[str, float], temperature: Optional[float] = None) -> str:
-        """Select action style using softmax with temperature"""
+    def action_probabilities(self, trait_vector: np.ndarray, context_vector: ContextVector,
+                             temperature: Optional[float] = None) -> Dict[str, float]:
+        """Compute the softmax action distribution in a single compiled kernel"""
         if temperature is None:
             temperature = self.temperature
         
-        # Convert utilities to probabilities using softmax
-        values = np.array(list(utilities.values()))
-        
-        # Handle edge case where all utilities are the same
-        if np.all(values == values[0]):
-            return np.random.choice(list(utilities.keys()))
-        
-        # Apply temperature scaling
-        scaled_values = values / temperature
-        
-        # Softmax with numerical stability
-        exp_values = np.exp(scaled_values - np.max(scaled_values))
-        probabilities = exp_values / np.sum(exp_values)
+        probabilities = score_and_softmax(
+            self.W_tensor,
+            np.ascontiguousarray(trait_vector, dtype=np.float32),
+            context_vector.to_numpy(),
+            self.b_vec,
+            float(temperature)
+        )
+        
+        return {action: float(probabilities[i]) for i, action in enumerate(self.actions)}
+    
+    @property
+    def temperature(self) -> float:
+        """Softmax temperature for action selection"""
+        return self._temperature
+    
+    @temperature.setter
+    def temperature(self, value: float) -> None:
+        self._temperature = value
+        self._inv_temp = 1.0 / value
+    
+    def act_probs(self, scores: np.ndarray, inv_temp: Optional[float] = None) -> np.ndarray:
+        """Numerically stable softmax of utility scores, scaled by 1/temperature"""
+        if inv_temp is None:
+            inv_temp = self._inv_temp
+        
+        # Max-subtract, exponentiate and normalize in place on one buffer
+        probabilities = scores * inv_temp
+        probabilities -= probabilities.max()
+        np.exp(probabilities, out=probabilities)
+        probabilities /= probabilities.sum()
+        return probabilities
+    
+    def select_action_style(
+        self,
+        utilities: Union[Dict[str, float], np.ndarray],
+        temperature: Optional[float] = None
+    ) -> str:
+        """
+        Select action style using softmax with temperature
+        
+        utilities is either the dict from compute_utilities or the array from
+        _compute_utilities_arr, whose entries follow self.actions.
+        """
+        if isinstance(utilities, np.ndarray):
+            values, names = utilities, self.actions
+        else:
+            values = np.fromiter(utilities.values(), dtype=np.float64, count=len(utilities))
+            names = list(utilities)
+        
+        inv_temp = self._inv_temp if temperature is None else 1.0 / temperature
+        
+        # Gumbel-max trick: the argmax of scaled utilities plus Gumbel noise is
+        # distributed exactly as the temperature softmax, without normalizing
+        return names[int(np.argmax(values * inv_temp + np.random.gumbel(size=len(values))))]
+    
+    def choose_action_style(
+        self,
+        trait_vector: np.ndarray,
+        context_vector: ContextVector,
+        temperature: Optional[float] = None
+    ) -> Tuple[str, Dict[str, float]]:
+        """
+        Compute utilities and sample an action style in one step
+        
+        With Numba installed, scoring, softmax and sampling run in a single
+        compiled kernel. Returns the chosen style and the utilities by action.
+        """
+        if NUMBA_AVAILABLE:
+            idx, scores = compute_and_sample(
+                self.W_tensor,
+                self.b_vec,
+                np.ascontiguousarray(trait_vector, dtype=np.float32),
+                context_vector.to_numpy(),
+                self._inv_temp if temperature is None else 1.0 / temperature,
+                np.random.random()
+            )
+            action_style = self.actions[idx]
+        else:
+            scores = self._compute_utilities_arr(trait_vector, context_vector)
+            action_style = self.select_action_style(scores, temperature)
         
-        # Sample from the distribution
-        action = np.random.choice(list(utilities.keys()), p=probabilities)
-        return action
+        return action_style, dict(zip(self.actions, scores.tolist()))
     
     def get_action_guidance(self, action_style: str) -> Dict[str, Any]:
         """Get detailed behavioral guidance for an action style"""
@@ -735,46 +842,65 @@ class ProductionTraitUtilityModel:
         return behavior_tags.get(action_style, ["natural"])
     
     def save_weights(self, filepath: str) -> None:
-        """Save the weight matrices and configuration"""
+        """Save the weight tensor and biases as .npz, with configuration in a JSON file"""
+        config_path, weights_path = _weight_file_paths(filepath)
+        np.savez(weights_path, W=self.W_tensor, b=self.b_vec)
+        
         data = {
-            "W": {action: matrix.tolist() for action, matrix in self.W.items()},
-            "b": self.b,
+            "weights_file": os.path.basename(weights_path),
+            "actions": self.actions,
             "temperature": self.temperature,
             "action_styles": self.ACTION_STYLES,
             "trait_dim": self.trait_dim,
             "context_dim": self.context_dim
         }
-        with open(filepath, 'w') as f:
+        with open(config_path, 'w') as f:
             json.dump(data, f, indent=2)
     
     def load_weights(self, filepath: str) -> None:
         """Load weight matrices from file"""
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
+        config_path, _ = _weight_file_paths(filepath)
+        if os.path.exists(config_path):
+            with open(config_path, 'r') as f:
                 data = json.load(f)
             
-            self.W = {action: np.array(matrix) for action, matrix in data["W"].items()}
-            self.b = data["b"]
+            if "W" in data:
+                # Legacy format with the matrices inlined in the JSON file
+                actions = list(data["W"].keys())
+                W_tensor = np.array([data["W"][action] for action in actions], dtype=np.float32)
+                b_vec = np.array([data["b"][action] for action in actions], dtype=np.float32)
+            else:
+                weights_path = os.path.join(os.path.dirname(config_path), data["weights_file"])
+                with np.load(weights_path) as arrays:
+                    W_tensor = np.ascontiguousarray(arrays["W"], dtype=np.float32)
+                    actions = data["actions"]
+                    b_vec = np.ascontiguousarray(arrays["b"], dtype=np.float32)
+            
+            self.actions = actions
+            self._set_weight_tensor(W_tensor)
+            self.b_vec = b_vec
             self.temperature = data.get("temperature", 0.4)
             if "action_styles" in data:
                 self.ACTION_STYLES = data["action_styles"]
     
     def analyze_personality_tendencies(self, trait_vector: np.ndarray) -> Dict[str, Any]:
         """Analyze which action styles a personality is most likely to exhibit"""
-        # Create a neutral context for analysis
-        neutral_context = np.ones(self.context_dim) * 0.5
-        neutral_context = neutral_context / np.linalg.norm(neutral_context)
-        
-        utilities = self.compute_utilities(trait_vector, neutral_context)
+        utilities = self.compute_utilities(trait_vector, self._neutral_context)
+        actions = list(utilities)
+        values = np.fromiter(utilities.values(), dtype=np.float64, count=len(actions))
         
-        # Sort by utility scores
-        sorted_actions = sorted(utilities.items(), key=lambda x: x[1], reverse=True)
+        # Only the extremes are reported, so partition instead of fully sorting
+        top = np.argpartition(values, -3)[-3:]
+        top = top[np.argsort(-values[top], kind='stable')]
+        bottom = np.argpartition(values, 2)[:2]
+        bottom = bottom[np.argsort(-values[bottom], kind='stable')]
+        top_actions = [(actions[i], utilities[actions[i]]) for i in top]
         
         return {
-            "top_action_styles": sorted_actions[:3],
-            "bottom_action_styles": sorted_actions[-2:],
+            "top_action_styles": top_actions,
+            "bottom_action_styles": [(actions[i], utilities[actions[i]]) for i in bottom],
             "utility_distribution": utilities,
-            "personality_summary": self._generate_personality_summary(sorted_actions[:3])
+            "personality_summary": self._generate_personality_summary(top_actions)
         }
     
     def _generate_personality_summary(self, top_actions: List[tuple]) -> str:
@@ -6,10 +6,11 @@ Maps 50-dimensional personality traits to action preferences.
 """
 
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pydantic import BaseModel
 import json
 import os
+from ..models.personality_system import TRAIT_NAME_TO_INDEX
 
 
 class ActionStyle(BaseModel):
@@ -21,6 +22,49 @@ class ActionStyle(BaseModel):
     social_preference: str   # "solitary", "neutral", "social"
 
 
+def _weight_file_paths(filepath: str) -> Tuple[str, str]:
+    """
+    Split a weights path into its (JSON config, .npz arrays) pair
+
+    A .npz path names the arrays, with the config beside it as .json;
+    any other path names the config, with the arrays beside it as .npz.
+    """
+    stem, ext = os.path.splitext(filepath)
+    if ext == ".npz":
+        return stem + ".json", filepath
+    return filepath, stem + ".npz"
+
+
+# Context dimension indices, matching ContextVector.CONTEXT_DIMENSIONS
+EMOTIONAL_INTENSITY = 0
+EMOTIONAL_VALENCE = 1
+USER_INTENT_SOCIAL = 5
+USER_INTENT_CARE = 6
+USER_INTENT_PLAY = 7
+USER_INTENT_COMMAND = 8
+RELATIONSHIP_QUALITY = 9
+ENERGY_LEVEL = 10
+PHYSICAL_NEEDS = 11
+COMFORT_LEVEL = 12
+COMPLEXITY_LEVEL = 15
+
+# User intent -> (intent dimension, value)
+INTENT_ROUTE = {
+    "greet": (USER_INTENT_SOCIAL, 0.8),
+    "bonding": (USER_INTENT_SOCIAL, 0.9),
+    "feed": (USER_INTENT_CARE, 0.7),
+    "comfort": (USER_INTENT_CARE, 0.8),
+    "play": (USER_INTENT_PLAY, 0.9),
+    "command": (USER_INTENT_COMMAND, 0.4),
+    "training": (USER_INTENT_COMMAND, 0.5),
+}
+
+_EMOTION_INTENSITY = {"happy": 0.8, "excited": 0.9, "sad": 0.2, "angry": 0.7, "calm": 0.3, "neutral": 0.5}
+_POSITIVE_EMOTIONS = frozenset({"happy", "excited", "calm"})
+_RELATIONSHIP_QUALITY = {"strong": 0.9, "developing": 0.6, "new": 0.3, "strained": 0.1}
+_COMPLEXITY_LEVEL = {"simple": 0.2, "moderate": 0.5, "complex": 0.8}
+
+
 class ContextVector:
     """
     Encodes the current situational context into a numerical vector
@@ -74,41 +118,33 @@ class ContextVector:
         creature_state: Any
     ) -> np.ndarray:
         """Convert agent data into a context vector"""
-        context = np.zeros(25)
+        vals = [0.0] * 25
         
         # Emotional context
-        emotion_map = {"happy": 0.8, "excited": 0.9, "sad": 0.2, "angry": 0.7, "calm": 0.3, "neutral": 0.5}
         primary_emotion = emotion_data.get('primary_emotion', 'neutral')
-        context[cls.CONTEXT_DIMENSIONS["emotional_intensity"]] = emotion_map.get(primary_emotion, 0.5)
-        context[cls.CONTEXT_DIMENSIONS["emotional_valence"]] = 0.8 if primary_emotion in ["happy", "excited", "calm"] else 0.3
+        vals[EMOTIONAL_INTENSITY] = _EMOTION_INTENSITY.get(primary_emotion, 0.5)
+        vals[EMOTIONAL_VALENCE] = 0.8 if primary_emotion in _POSITIVE_EMOTIONS else 0.3
         
-        # Social context
-        intent_map = {
-            "greet": 0.8, "bonding": 0.9, "play": 0.9, "feed": 0.7, 
-            "command": 0.4, "training": 0.5, "comfort": 0.8
-        }
-        user_intent = perception_data.get('user_intent', 'unknown')
-        if user_intent in intent_map:
-            context[cls.CONTEXT_DIMENSIONS["user_intent_social"]] = intent_map[user_intent] if user_intent in ["greet", "bonding"] else 0.3
-            context[cls.CONTEXT_DIMENSIONS["user_intent_care"]] = intent_map[user_intent] if user_intent in ["feed", "comfort"] else 0.3
-            context[cls.CONTEXT_DIMENSIONS["user_intent_play"]] = intent_map[user_intent] if user_intent == "play" else 0.3
-            context[cls.CONTEXT_DIMENSIONS["user_intent_command"]] = intent_map[user_intent] if user_intent in ["command", "training"] else 0.3
+        # Social context: a recognized intent sets its own dimension and 0.3 on the others
+        route = INTENT_ROUTE.get(perception_data.get('user_intent', 'unknown'))
+        if route is not None:
+            vals[USER_INTENT_SOCIAL:USER_INTENT_COMMAND + 1] = (0.3, 0.3, 0.3, 0.3)
+            vals[route[0]] = route[1]
         
         # Relationship quality
-        relationship_map = {"strong": 0.9, "developing": 0.6, "new": 0.3, "strained": 0.1}
-        relationship = memory_data.get('relationship', 'neutral')
-        context[cls.CONTEXT_DIMENSIONS["relationship_quality"]] = relationship_map.get(relationship, 0.5)
+        vals[RELATIONSHIP_QUALITY] = _RELATIONSHIP_QUALITY.get(memory_data.get('relationship', 'neutral'), 0.5)
         
         # Physical context
         if hasattr(creature_state, 'stats'):
-            context[cls.CONTEXT_DIMENSIONS["energy_level"]] = creature_state.stats.get("energy", 50) / 100
-            context[cls.CONTEXT_DIMENSIONS["physical_needs"]] = 1.0 - (creature_state.stats.get("hunger", 50) / 100)
-            context[cls.CONTEXT_DIMENSIONS["comfort_level"]] = creature_state.stats.get("happiness", 50) / 100
+            stats = creature_state.stats
+            vals[ENERGY_LEVEL] = stats.get("energy", 50) / 100
+            vals[PHYSICAL_NEEDS] = 1.0 - (stats.get("hunger", 50) / 100)
+            vals[COMFORT_LEVEL] = stats.get("happiness", 50) / 100
         
         # Cognitive context
-        complexity_map = {"simple": 0.2, "moderate": 0.5, "complex": 0.8}
-        complexity = perception_data.get('complexity', 'moderate')
-        context[cls.CONTEXT_DIMENSIONS["complexity_level"]] = complexity_map.get(complexity, 0.5)
+        vals[COMPLEXITY_LEVEL] = _COMPLEXITY_LEVEL.get(perception_data.get('complexity', 'moderate'), 0.5)
+        
+        context = np.array(vals, dtype=np.float32)
         
         # Normalize the vector
         norm = np.linalg.norm(context)
@@ -198,34 +234,67 @@ class TraitUtilityModel:
         )
     }
     
+    # Maximum number of distinct trait vectors whose projections are cached
+    TRAIT_CACHE_SIZE = 256
+    
     def __init__(self, trait_dim: int = 50, context_dim: int = 25):
         self.trait_dim = trait_dim
         self.context_dim = context_dim
         self.actions = list(self.ACTION_STYLES.keys())
         
-        # Initialize weight matrices and biases
+        # Initialize weight matrices and biases, stored as one contiguous
+        # (actions, traits, contexts) tensor plus an aligned bias vector
         # In a production system, these would be learned from data
-        self.W = self._initialize_weight_matrices()
-        self.b = {action: 0.0 for action in self.actions}
+        self._set_weight_tensor(self._initialize_weight_matrices())
+        self.b_vec = np.zeros(len(self.actions), dtype=np.float32)
         
         # Temperature for action selection
         self.temperature = 0.3
     
-    def _initialize_weight_matrices(self) -> Dict[str, np.ndarray]:
+    def _initialize_weight_matrices(self) -> np.ndarray:
         """Initialize weight matrices with reasonable defaults based on trait-action relationships"""
-        W = {}
+        # One 50x25 weight matrix per action, initialized with small random values
+        # and stored as float32 to halve the memory traffic of every product
+        W = (np.random.randn(len(self.actions), self.trait_dim, self.context_dim) * 0.1).astype(np.float32)
         
-        for action in self.actions:
-            # Create a 50x25 weight matrix for each action
-            # Initialize with small random values
-            W[action] = np.random.randn(self.trait_dim, self.context_dim) * 0.1
-            
+        for i, action in enumerate(self.actions):
             # Set some intuitive weights based on trait-action relationships
             # This is a simplified version - in practice you'd learn these weights
-            self._set_intuitive_weights(W[action], action)
+            self._set_intuitive_weights(W[i], action)
         
         return W
     
+    def _set_weight_tensor(self, W_tensor: np.ndarray) -> None:
+        """Install the weight tensor along with the action name -> row index map"""
+        self.W_tensor = W_tensor
+        self.action_to_idx = {action: i for i, action in enumerate(self.actions)}
+        # Name-keyed views into W_tensor, kept for weight export
+        self.W = {action: W_tensor[i] for action, i in self.action_to_idx.items()}
+        # Projections computed against the previous weights are no longer valid
+        self._trait_cache: Dict[bytes, np.ndarray] = {}
+    
+    def _trait_projection(self, trait_vector: np.ndarray) -> np.ndarray:
+        """P^T * W_a for every action as an (A, C) matrix, cached per trait vector"""
+        trait_vector = np.ascontiguousarray(trait_vector, dtype=np.float32)
+        key = trait_vector.tobytes()
+        projection = self._trait_cache.get(key)
+        if projection is None:
+            if len(self._trait_cache) >= self.TRAIT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._trait_cache[next(iter(self._trait_cache))]
+            projection = trait_vector @ self.W_tensor
+            self._trait_cache[key] = projection
+        return projection
+    
+    @property
+    def b(self) -> Dict[str, float]:
+        """Biases by action name; a snapshot of b_vec, so assign to change it"""
+        return dict(zip(self.actions, self.b_vec.tolist()))
+    
+    @b.setter
+    def b(self, biases: Dict[str, float]) -> None:
+        self.b_vec = np.array([biases[action] for action in self.actions], dtype=np.float32)
+    
     def _set_intuitive_weights(self, weight_matrix: np.ndarray, action: str) -> None:
         """Set some intuitive weights for trait-action relationships"""
         # This is a simplified mapping - in practice you'd learn these from data
@@ -249,45 +318,54 @@ class TraitUtilityModel:
         
         if action in trait_action_mappings:
             for trait_name, context_indices in trait_action_mappings[action].items():
-                # This is simplified - you'd want proper trait name to index mapping
-                trait_idx = hash(trait_name) % self.trait_dim  # Placeholder
-                for context_idx in context_indices:
-                    if context_idx < self.context_dim:
-                        weight_matrix[trait_idx, context_idx] += 0.3
+                trait_idx = TRAIT_NAME_TO_INDEX.get(trait_name)
+                if trait_idx is None or trait_idx >= self.trait_dim:
+                    continue
+                context_idx = [c for c in context_indices if c < self.context_dim]
+                weight_matrix[trait_idx, context_idx] += 0.3
     
     def compute_utilities(self, trait_vector: np.ndarray, context_vector: np.ndarray) -> Dict[str, float]:
         """Compute utility scores for each action style"""
-        utilities = {}
-        
-        for action in self.actions:
-            # U(a|P,x) = P^T * W_a * x + b_a
-            utility = float(trait_vector.T @ self.W[action] @ context_vector + self.b[action])
-            utilities[action] = utility
+        return dict(zip(self.actions, self._compute_utilities_arr(trait_vector, context_vector).tolist()))
+    
+    def _compute_utilities_arr(self, trait_vector: np.ndarray, context_vector: np.ndarray) -> np.ndarray:
+        """Utility scores as an array in self.actions order"""
+        # U(a|P,x) = P^T * W_a * x + b_a for all actions, with P^T * W_a cached
+        # per trait vector since traits change far less often than context
+        return self._trait_projection(trait_vector) @ context_vector + self.b_vec
+    
+    def compute_utilities_batch(self, trait_matrix: np.ndarray, context_matrix: np.ndarray) -> np.ndarray:
+        """Compute utilities for B creatures at once from (B, T) traits and (B, C) contexts; returns (B, A)"""
+        trait_matrix = np.asarray(trait_matrix, dtype=np.float32)
+        context_matrix = np.asarray(context_matrix, dtype=np.float32)
         
-        return utilities
+        # Contract contexts first so the large (A, T, C) tensor is read once per batch
+        projected = np.einsum('atc,bc->bat', self.W_tensor, context_matrix)
+        return np.einsum('bat,bt->ba', projected, trait_matrix) + self.b_vec
     
-    def select_action_style(self, utilities: Dict[str, float], temperature: Optional[float] = None) -> str:
-        """Select action style using softmax with temperature"""
+    def select_action_style(
+        self,
+        utilities: Union[Dict[str, float], np.ndarray],
+        temperature: Optional[float] = None
+    ) -> str:
+        """
+        Select action style using softmax with temperature
+        
+        utilities is either the dict from compute_utilities or the array from
+        _compute_utilities_arr, whose entries follow self.actions.
+        """
         if temperature is None:
             temperature = self.temperature
         
-        # Convert utilities to probabilities using softmax
-        values = np.array(list(utilities.values()))
-        
-        # Handle edge case where all utilities are the same
-        if np.all(values == values[0]):
-            return np.random.choice(list(utilities.keys()))
-        
-        # Apply temperature scaling
-        scaled_values = values / temperature
+        if isinstance(utilities, np.ndarray):
+            values, names = utilities, self.actions
+        else:
+            values = np.fromiter(utilities.values(), dtype=np.float64, count=len(utilities))
+            names = list(utilities)
         
-        # Softmax
-        exp_values = np.exp(scaled_values - np.max(scaled_values))  # Subtract max for numerical stability
-        probabilities = exp_values / np.sum(exp_values)
-        
-        # Sample from the distribution
-        action = np.random.choice(list(utilities.keys()), p=probabilities)
-        return action
+        # Gumbel-max trick: the argmax of scaled utilities plus Gumbel noise is
+        # distributed exactly as the temperature softmax, without normalizing
+        return names[int(np.argmax(values / temperature + np.random.gumbel(size=len(values))))]
     
     def get_action_guidance(self, action_style: str) -> Dict[str, Any]:
         """Get behavioral guidance for an action style"""
@@ -307,21 +385,38 @@ class TraitUtilityModel:
         }
     
     def save_weights(self, filepath: str) -> None:
-        """Save the learned weight matrices"""
+        """Save the learned weight tensor and biases as .npz, with configuration in a JSON file"""
+        config_path, weights_path = _weight_file_paths(filepath)
+        np.savez(weights_path, W=self.W_tensor, b=self.b_vec)
+        
         data = {
-            "W": {action: matrix.tolist() for action, matrix in self.W.items()},
-            "b": self.b,
+            "weights_file": os.path.basename(weights_path),
+            "actions": self.actions,
             "temperature": self.temperature
         }
-        with open(filepath, 'w') as f:
+        with open(config_path, 'w') as f:
             json.dump(data, f)
     
     def load_weights(self, filepath: str) -> None:
         """Load weight matrices from file"""
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
+        config_path, _ = _weight_file_paths(filepath)
+        if os.path.exists(config_path):
+            with open(config_path, 'r') as f:
                 data = json.load(f)
             
-            self.W = {action: np.array(matrix) for action, matrix in data["W"].items()}
-            self.b = data["b"]
+            if "W" in data:
+                # Legacy format with the matrices inlined in the JSON file
+                actions = list(data["W"].keys())
+                W_tensor = np.array([data["W"][action] for action in actions], dtype=np.float32)
+                b_vec = np.array([data["b"][action] for action in actions], dtype=np.float32)
+            else:
+                weights_path = os.path.join(os.path.dirname(config_path), data["weights_file"])
+                with np.load(weights_path) as arrays:
+                    W_tensor = np.ascontiguousarray(arrays["W"], dtype=np.float32)
+                    actions = data["actions"]
+                    b_vec = np.ascontiguousarray(arrays["b"], dtype=np.float32)
+            
+            self.actions = actions
+            self._set_weight_tensor(W_tensor)
+            self.b_vec = b_vec
             self.temperature = data.get("temperature", 0.3)
\ No newline at end of file
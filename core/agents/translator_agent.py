@@ -4,12 +4,145 @@ Translator Agent - Creates final creature language and human translation
 Adapted from the translator logic in WiddlePupper's AIAgentSystem.swift
 """
 
-from typing import Dict, Any
+import functools
+import re
+import time
+import types
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from ..models.creature import CreatureState
 from ..models.creature_template import CreatureTemplate
 from .ai_client import AIClient
 
 
+# One "KEY: value" line of the translation response format
+_RESPONSE_RE = re.compile(
+    r"^[ \t]*(CREATURE_LANGUAGE|HUMAN_TRANSLATION|DEBUG)[ \t]*:(.*)$",
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Response key -> translation data field
+_RESPONSE_FIELDS = {
+    "CREATURE_LANGUAGE": "creature_language",
+    "HUMAN_TRANSLATION": "human_translation",
+    "DEBUG": "debug_info"
+}
+
+# Per-species behavioral guidelines for the translation prompt
+_SPECIES_GUIDELINES = types.MappingProxyType({
+    "human": """
+   - Use human actions: *nods*, *shrugs*, *gestures*, *leans forward*, *smiles*, *laughs*
+   - Use human sounds: *speaks softly*, *chuckles*, *sighs*, *hums*, *whispers*
+   - NEVER use animal behaviors: NO tail wagging, purring, barking, ear twitching, etc.
+   - Focus on facial expressions, body language, and speech patterns""",
+    
+    "dog": """
+   - Use dog actions: *tail wagging*, *head tilt*, *panting*, *play bow*, *sniffing*
+   - Use dog sounds: *woof*, *bark*, *whine*, *growl*, *yip*, *howl*
+   - Focus on canine body language and vocalizations""",
+    
+    "cat": """
+   - Use cat actions: *tail flick*, *slow blink*, *head bump*, *kneading*, *stretch*
+   - Use cat sounds: *meow*, *purr*, *chirp*, *hiss*, *trill*, *mrow*
+   - Focus on feline grace and independence""",
+    
+    "dragon": """
+   - Use dragon actions: *wing flutter*, *smoke puff*, *tail sweep*, *scale shimmer*
+   - Use dragon sounds: *rumble*, *roar*, *snort*, *growl*, *whistle*
+   - Focus on majestic, powerful movements""",
+    
+    "fairy": """
+   - Use fairy actions: *flutter*, *glow*, *sparkle*, *dance*, *twirl*, *hover*
+   - Use fairy sounds: *chime*, *bell*, *whisper*, *giggle*, *sing*, *hum*
+   - Focus on magical, delicate movements""",
+    
+    "elf": """
+   - Use elf actions: *graceful movement*, *keen observation*, *light step*, *elegant gesture*
+   - Use elf sounds: *whispers*, *soft chant*, *melodic hum*, *gentle voice*
+   - Focus on grace and perceptiveness""",
+    
+    "dwarf": """
+   - Use dwarf actions: *sturdy stance*, *strong grip*, *determined nod*, *confident posture*
+   - Use dwarf sounds: *gruff voice*, *hearty laugh*, *grumble*, *robust tone*
+   - Focus on strength and determination""",
+    
+    "gnome": """
+   - Use gnome actions: *fidgets with tools*, *adjusts spectacles*, *examines closely*, *inventive gesture*
+   - Use gnome sounds: *curious mutter*, *excited chatter*, *thoughtful hmm*, *clever giggle*
+   - Focus on curiosity and tinkering""",
+    
+    "sprite": """
+   - Use sprite actions: *quick dart*, *shimmering movement*, *tiny gesture*, *delicate flutter*
+   - Use sprite sounds: *tiny voice*, *silvery laugh*, *whispered secret*, *musical chime*
+   - Focus on quickness and mischief"""
+})
+
+_DEFAULT_GUIDELINE_FMT = "Use behaviors appropriate for {species}"
+
+
+@functools.lru_cache(maxsize=32)
+def _species_guidelines(species: str) -> str:
+    """Species-specific behavioral guidelines block"""
+    guidelines = _SPECIES_GUIDELINES.get(species)
+    return guidelines if guidelines is not None else _DEFAULT_GUIDELINE_FMT.format(species=species)
+
+
+# Per-species part of the translation system prompt
+_STATIC_TEMPLATE = """You are the Translator Agent for a {species}.
+
+Your role is to translate the creature's human language thoughts into authentic creature language.
+
+Your task is to translate the human message into creature language:
+1. ONLY use expressions appropriate for {species}:
+   - Physical actions in asterisks that this species can actually do
+   - Species-appropriate sounds in asterisks that this species would make
+   - Descriptive behaviors authentic to this species
+
+2. SPECIES-SPECIFIC GUIDELINES:
+   {guidelines}
+
+3. NEVER use:
+   - Human words or phrases (except in HUMAN_TRANSLATION)
+   - Emojis or punctuation outside asterisks
+   - Actions this species cannot physically perform
+   - Sounds this species cannot make
+
+4. Match energy level and physical state:
+   - Low energy: tired actions, quiet sounds
+   - High energy: active behaviors, louder expressions
+   - Consider current stats and mood
+
+5. Template authenticity:
+   - Follow behavioral patterns from the creature template
+   - Use only sounds defined in the template
+   - Maintain authentic creature perspective
+
+Response format:
+CREATURE_LANGUAGE: (translate the human message into creature actions and sounds)
+HUMAN_TRANSLATION: (pass through the original human message exactly as provided)
+DEBUG: (explanation of translation choices made)"""
+
+
+@functools.lru_cache(maxsize=32)
+def _static_block(species: str) -> str:
+    """Per-species part of the translation system prompt"""
+    return _STATIC_TEMPLATE.format(species=species, guidelines=_species_guidelines(species))
+
+
+# Creature state part of the translation system prompt, filled per request
+_STATE_TEMPLATE = """Current state: {mood}
+Energy level: {energy}/100
+
+Available creature sounds by emotion:
+{sounds}"""
+
+
+# Expected shape of a translation response, used as a speculative draft
+_PREDICTION_TEMPLATE = """CREATURE_LANGUAGE: 
+HUMAN_TRANSLATION: {human_response}
+DEBUG: """
+
+
 class TranslatorAgent:
     """
     Creates the final creature language response and optional human translation
@@ -21,8 +154,16 @@ class TranslatorAgent:
     - Ensures authenticity to creature perspective
     """
     
+    # Translation result cache limits
+    CACHE_MAX_SIZE = 4096
+    CACHE_TTL_SECONDS = 300.0
+    
     def __init__(self, ai_client: AIClient):
         self.ai_client = ai_client
+        
+        # Coarse input fingerprint -> (stored_at, translation_data)
+        self._cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
     
     async def translate(
         self, 
@@ -33,49 +174,53 @@ class TranslatorAgent:
     ) -> Dict[str, Any]:
         """
         Create final creature language and translation
+        
+        When the creature is too distressed to be translated, the rule-based
+        creature language is returned as-is and no model call is made.
         """
         
-        system_prompt = self._build_system_prompt(creature_state, template)
+        can_translate, translation_hint = self._translation_gate(creature_state)
+        if not can_translate:
+            return {
+                "creature_language": base_creature_language or "*quiet sound*",
+                "human_translation": None,
+                "can_translate": False,
+                "translation_hint": translation_hint
+            }
+        
+        # Repeated decisions in a similar state translate the same way
+        cache_key = self._cache_key(decision_data, creature_state)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # The species instructions come first so providers can cache them as a prefix
+        static_prefix, dynamic_suffix = self._build_system_prompt(creature_state, template)
+        system_prompt = [
+            {"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": dynamic_suffix},
+        ]
         
         # Format decision data for translation
         user_message = self._format_decision_data(decision_data, base_creature_language, creature_state)
         
+        # The response format is fixed and HUMAN_TRANSLATION echoes the input,
+        # so most of the output is known in advance and can be drafted
+        prediction = _PREDICTION_TEMPLATE.format(
+            human_response=decision_data.get('human_response', 'I hear you.')
+        )
+        
         try:
-            response = await self.ai_client.generate_response(
+            response = await self.ai_client.generate_response_batched(
                 system_prompt=system_prompt,
                 user_message=user_message,
+                prediction=prediction,
                 temperature=0.6
             )
             
             result = self._parse_translation_response(response)
-            
-            # Use creature's own translation logic (which is more user-friendly)
-            from ..models.creature import Creature
-            # We can't directly access the creature here, so we'll create a temporary one
-            # In a real implementation, we'd pass the creature or its can_translate status
-            
-            # For now, use the improved logic directly
-            happiness = creature_state.stats.get("happiness", 50)
-            energy = creature_state.stats.get("energy", 50)
-            
-            can_translate = True
-            translation_hint = None
-            
-            # Apply the same improved logic as in creature.can_translate()
-            if happiness < 20 and energy < 20:
-                can_translate = False
-                translation_hint = f"Your {creature_state.species} seems very distressed (happiness: {happiness:.0f}, energy: {energy:.0f}). Try feeding, petting, or playing to help them feel better!"
-            elif happiness < 10:
-                can_translate = False
-                translation_hint = f"Your {creature_state.species} is very upset (happiness: {happiness:.0f}). They need comfort - try petting, feeding, or giving them space to recover."
-            elif energy < 5:
-                can_translate = False
-                translation_hint = f"Your {creature_state.species} is exhausted (energy: {energy:.0f}). They need rest or food to regain energy before they can communicate clearly."
-            
-            result["can_translate"] = can_translate
-            if translation_hint:
-                result["translation_hint"] = translation_hint
-            
+            result["can_translate"] = True
+            self._cache_put(cache_key, result)
             return result
             
         except Exception as e:
@@ -87,108 +232,77 @@ class TranslatorAgent:
                 "error": str(e)
             }
     
-    def _build_system_prompt(self, creature_state: CreatureState, template: CreatureTemplate) -> str:
-        """Build the system prompt for translation"""
+    @staticmethod
+    def _cache_key(decision_data: Dict[str, Any], creature_state: CreatureState) -> Tuple:
+        """Fingerprint of the inputs that shape a translation, with energy in deciles"""
+        return (
+            creature_state.template_id,
+            creature_state.species,
+            creature_state.mood,
+            int(creature_state.stats.get('energy', 50) // 10),
+            decision_data.get('action', 'unknown'),
+            decision_data.get('vocalization', 'unknown'),
+            decision_data.get('energy_level', 'medium'),
+            decision_data.get('human_response', 'I hear you.')
+        )
+    
+    def _cache_get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of a live cache entry, or None on miss/expiry"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            stored_at, translation_data = entry
+            if time.monotonic() - stored_at < self.CACHE_TTL_SECONDS:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return dict(translation_data)
+            del self._cache[key]
         
-        # Get available sounds for this creature type
-        available_sounds = []
-        for emotion, sounds in template.language.sounds.items():
-            available_sounds.extend([f"{emotion}: {', '.join(sounds)}"])
-        sounds_summary = "\n".join(available_sounds)
+        self.stats["misses"] += 1
+        return None
+    
+    def _cache_put(self, key: Tuple, translation_data: Dict[str, Any]) -> None:
+        """Store a parsed translation, evicting the least recently used entry"""
+        self._cache[key] = (time.monotonic(), dict(translation_data))
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+    
+    def _translation_gate(self, creature_state: CreatureState) -> Tuple[bool, Optional[str]]:
+        """
+        Whether the creature is willing to have its message translated
         
-        system_prompt = f"""You are the Translator Agent for a {creature_state.species}.
-
-Your role is to translate the creature's human language thoughts into authentic creature language.
-
-Current state: {creature_state.mood}
-Energy level: {creature_state.stats.get('energy', 50)}/100
-
-Available creature sounds by emotion:
-{sounds_summary}
-
-Your task is to translate the human message into creature language:
-1. ONLY use expressions appropriate for {creature_state.species}:
-   - Physical actions in asterisks that this species can actually do
-   - Species-appropriate sounds in asterisks that this species would make
-   - Descriptive behaviors authentic to this species
-
-2. SPECIES-SPECIFIC GUIDELINES:
-   {self._get_species_guidelines(creature_state.species)}
-
-3. NEVER use:
-   - Human words or phrases (except in HUMAN_TRANSLATION)
-   - Emojis or punctuation outside asterisks
-   - Actions this species cannot physically perform
-   - Sounds this species cannot make
-
-4. Match energy level and physical state:
-   - Low energy: tired actions, quiet sounds
-   - High energy: active behaviors, louder expressions
-   - Consider current stats and mood
-
-5. Template authenticity:
-   - Follow behavioral patterns from the creature template
-   - Use only sounds defined in the template
-   - Maintain authentic creature perspective
-
-Response format:
-CREATURE_LANGUAGE: (translate the human message into creature actions and sounds)
-HUMAN_TRANSLATION: (pass through the original human message exactly as provided)
-DEBUG: (explanation of translation choices made)"""
-
-        return system_prompt
+        Returns (can_translate, translation_hint); the hint tells the user how to
+        help when translation is refused.
+        """
+        happiness = creature_state.stats.get("happiness", 50)
+        energy = creature_state.stats.get("energy", 50)
+        
+        # Apply the same improved logic as in creature.can_translate()
+        if happiness < 20 and energy < 20:
+            return False, f"Your {creature_state.species} seems very distressed (happiness: {happiness:.0f}, energy: {energy:.0f}). Try feeding, petting, or playing to help them feel better!"
+        elif happiness < 10:
+            return False, f"Your {creature_state.species} is very upset (happiness: {happiness:.0f}). They need comfort - try petting, feeding, or giving them space to recover."
+        elif energy < 5:
+            return False, f"Your {creature_state.species} is exhausted (energy: {energy:.0f}). They need rest or food to regain energy before they can communicate clearly."
+        
+        return True, None
     
-    def _get_species_guidelines(self, species: str) -> str:
-        """Get species-specific behavioral guidelines"""
-        guidelines = {
-            "human": """
-   - Use human actions: *nods*, *shrugs*, *gestures*, *leans forward*, *smiles*, *laughs*
-   - Use human sounds: *speaks softly*, *chuckles*, *sighs*, *hums*, *whispers*
-   - NEVER use animal behaviors: NO tail wagging, purring, barking, ear twitching, etc.
-   - Focus on facial expressions, body language, and speech patterns""",
-            
-            "dog": """
-   - Use dog actions: *tail wagging*, *head tilt*, *panting*, *play bow*, *sniffing*
-   - Use dog sounds: *woof*, *bark*, *whine*, *growl*, *yip*, *howl*
-   - Focus on canine body language and vocalizations""",
-            
-            "cat": """
-   - Use cat actions: *tail flick*, *slow blink*, *head bump*, *kneading*, *stretch*
-   - Use cat sounds: *meow*, *purr*, *chirp*, *hiss*, *trill*, *mrow*
-   - Focus on feline grace and independence""",
-            
-            "dragon": """
-   - Use dragon actions: *wing flutter*, *smoke puff*, *tail sweep*, *scale shimmer*
-   - Use dragon sounds: *rumble*, *roar*, *snort*, *growl*, *whistle*
-   - Focus on majestic, powerful movements""",
-            
-            "fairy": """
-   - Use fairy actions: *flutter*, *glow*, *sparkle*, *dance*, *twirl*, *hover*
-   - Use fairy sounds: *chime*, *bell*, *whisper*, *giggle*, *sing*, *hum*
-   - Focus on magical, delicate movements""",
-            
-            "elf": """
-   - Use elf actions: *graceful movement*, *keen observation*, *light step*, *elegant gesture*
-   - Use elf sounds: *whispers*, *soft chant*, *melodic hum*, *gentle voice*
-   - Focus on grace and perceptiveness""",
-            
-            "dwarf": """
-   - Use dwarf actions: *sturdy stance*, *strong grip*, *determined nod*, *confident posture*
-   - Use dwarf sounds: *gruff voice*, *hearty laugh*, *grumble*, *robust tone*
-   - Focus on strength and determination""",
-            
-            "gnome": """
-   - Use gnome actions: *fidgets with tools*, *adjusts spectacles*, *examines closely*, *inventive gesture*
-   - Use gnome sounds: *curious mutter*, *excited chatter*, *thoughtful hmm*, *clever giggle*
-   - Focus on curiosity and tinkering""",
-            
-            "sprite": """
-   - Use sprite actions: *quick dart*, *shimmering movement*, *tiny gesture*, *delicate flutter*
-   - Use sprite sounds: *tiny voice*, *silvery laugh*, *whispered secret*, *musical chime*
-   - Focus on quickness and mischief"""
-        }
+    def _build_system_prompt(self, creature_state: CreatureState, template: CreatureTemplate) -> Tuple[str, str]:
+        """
+        Build the system prompt for translation
         
-        return guidelines.get(species, f"Use behaviors appropriate for {species}")
+        Returns (static_prefix, dynamic_suffix). The prefix only depends on the
+        species; the suffix carries the template's sounds and the creature's state.
+        """
+        static_prefix = _static_block(creature_state.species)
+        
+        dynamic_suffix = _STATE_TEMPLATE.format_map({
+            "mood": creature_state.mood,
+            "energy": creature_state.stats.get('energy', 50),
+            "sounds": template.sounds_summary,
+        })
+        
+        return static_prefix, dynamic_suffix
     
     def _format_decision_data(
         self, 
@@ -218,34 +332,11 @@ Please translate the human message "{human_response}" into authentic creature la
     def _check_translation_conditions(self, creature_state: CreatureState, template: CreatureTemplate) -> bool:
         """Check if translation conditions are met based on template rules"""
         
-        conditions = template.language.translation_conditions
-        
-        for stat_condition, requirement in conditions.items():
-            stat_value = creature_state.stats.get(stat_condition, 0)
-            
-            # Parse requirement (e.g., "> 50", ">= 30", "< 20")
-            if requirement.startswith(">="):
-                threshold = float(requirement[2:].strip())
-                if stat_value < threshold:
-                    return False
-            elif requirement.startswith("<="):
-                threshold = float(requirement[2:].strip())
-                if stat_value > threshold:
-                    return False
-            elif requirement.startswith(">"):
-                threshold = float(requirement[1:].strip())
-                if stat_value <= threshold:
-                    return False
-            elif requirement.startswith("<"):
-                threshold = float(requirement[1:].strip())
-                if stat_value >= threshold:
-                    return False
-            elif requirement.startswith("="):
-                threshold = float(requirement[1:].strip())
-                if stat_value != threshold:
-                    return False
-        
-        return True
+        stats = creature_state.stats
+        return all(
+            op(stats.get(stat, 0), threshold)
+            for stat, op, threshold in template.compiled_translation_conditions
+        )
     
     def _parse_translation_response(self, response: str) -> Dict[str, Any]:
         """Parse the AI response into structured translation data"""
@@ -256,18 +347,7 @@ Please translate the human message "{human_response}" into authentic creature la
             "debug_info": ""
         }
         
-        lines = response.strip().split('\n')
-        for line in lines:
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip().upper().replace('_', '_')
-                value = value.strip()
-                
-                if key == "CREATURE_LANGUAGE":
-                    translation_data["creature_language"] = value
-                elif key == "HUMAN_TRANSLATION":
-                    translation_data["human_translation"] = value
-                elif key == "DEBUG":
-                    translation_data["debug_info"] = value
+        for match in _RESPONSE_RE.finditer(response):
+            translation_data[_RESPONSE_FIELDS[match.group(1).upper()]] = match.group(2).strip()
         
         return translation_data
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Utility Kernels - Numeric inner loops for the trait-based utility models
+
+The per-decision score s[a] = sum_{t,c} W[a,t,c] * trait[t] * ctx[c] + b[a]
+followed by a temperature softmax is a small, purely numeric kernel. When
+Numba is installed it is JIT-compiled to native code; otherwise an
+equivalent NumPy implementation is used.
+"""
+
+import numpy as np
+
+# Numba is optional (pip install numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+def _score_and_softmax_numpy(W: np.ndarray, traits: np.ndarray, ctx: np.ndarray,
+                             bias: np.ndarray, temperature: float) -> np.ndarray:
+    """Action probabilities for one trait/context pair using NumPy"""
+    scores = (W @ ctx) @ traits + bias
+    scaled = scores / temperature
+    exp_scores = np.exp(scaled - np.max(scaled))
+    return exp_scores / np.sum(exp_scores)
+
+
+def _score_and_softmax_loops(W, traits, ctx, bias, temperature):
+    """Action probabilities for one trait/context pair as explicit loops"""
+    n_actions, n_traits, n_contexts = W.shape
+    scores = np.empty(n_actions, dtype=np.float64)
+
+    for a in range(n_actions):
+        acc = 0.0
+        for t in range(n_traits):
+            trait = traits[t]
+            if trait == 0.0:
+                continue
+            row = 0.0
+            # Contiguous innermost loop, vectorized by LLVM
+            for c in range(n_contexts):
+                row += W[a, t, c] * ctx[c]
+            acc += trait * row
+        scores[a] = (acc + bias[a]) / temperature
+
+    max_score = scores[0]
+    for a in range(1, n_actions):
+        if scores[a] > max_score:
+            max_score = scores[a]
+
+    total = 0.0
+    for a in range(n_actions):
+        scores[a] = np.exp(scores[a] - max_score)
+        total += scores[a]
+    for a in range(n_actions):
+        scores[a] /= total
+
+    return scores
+
+
+def _compute_and_sample_loops(W, b, P, x, inv_temp, u):
+    """
+    Score every action, then sample one from the temperature softmax
+
+    u is a uniform draw in [0, 1). Returns the sampled action index and the
+    raw utility scores.
+    """
+    n_actions, n_traits, n_contexts = W.shape
+    scores = np.empty(n_actions, dtype=np.float64)
+
+    for a in range(n_actions):
+        acc = 0.0
+        for t in range(n_traits):
+            trait = P[t]
+            if trait == 0.0:
+                continue
+            row = 0.0
+            for c in range(n_contexts):
+                row += W[a, t, c] * x[c]
+            acc += trait * row
+        scores[a] = acc + b[a]
+
+    max_scaled = scores[0] * inv_temp
+    for a in range(1, n_actions):
+        scaled = scores[a] * inv_temp
+        if scaled > max_scaled:
+            max_scaled = scaled
+
+    # Unnormalized CDF; the draw is scaled by its total instead of normalizing
+    cdf = np.empty(n_actions, dtype=np.float64)
+    total = 0.0
+    for a in range(n_actions):
+        total += np.exp(scores[a] * inv_temp - max_scaled)
+        cdf[a] = total
+
+    target = u * total
+    idx = n_actions - 1
+    for a in range(n_actions):
+        if cdf[a] > target:
+            idx = a
+            break
+
+    return idx, scores
+
+
+if NUMBA_AVAILABLE:
+    score_and_softmax = njit(cache=True, fastmath=True)(_score_and_softmax_loops)
+    compute_and_sample = njit(cache=True, fastmath=True, boundscheck=False)(_compute_and_sample_loops)
+else:
+    score_and_softmax = _score_and_softmax_numpy
+    # Interpreted loops are far slower than NumPy; callers should check
+    # NUMBA_AVAILABLE and take a vectorized path instead
+    compute_and_sample = _compute_and_sample_loops
@@ -5,12 +5,57 @@ Handles species-specific language generation, cultural localization, and
 behavioral patterns for different creature types.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Pattern, Tuple
+import functools
 import random
+import re
 from ..models.creature import CreatureState
 from ..models.creature_template import CreatureTemplate
 
 
+# Action rewrites applied when energy is low, keyed by energy state
+_ENERGY_REPLACEMENTS: Dict[str, Dict[str, str]] = {
+    "very_tired": {
+        "*jump*": "*slow movement*",
+        "*bounce*": "*gentle sway*",
+        "*run*": "*slow walk*",
+        "*pounce*": "*careful approach*",
+        "*leap*": "*small step*",
+        "*excited*": "*weary*",
+        "*energetic*": "*tired*"
+    },
+    "tired": {
+        "*jump*": "*small hop*",
+        "*bounce*": "*gentle movement*",
+        "*run*": "*trot*",
+        "*excited*": "*mildly interested*"
+    }
+}
+
+_SAD_REPLACEMENTS = {"*happy*": "*subdued*"}
+
+# Case-insensitive sentinels that suppress the sad and hungry prefixes
+_SAD_WORDS_RE = re.compile(r"\*(?:droop|whimper|sad)\*", re.IGNORECASE)
+_HUNGER_WORDS_RE = re.compile(r"\*(?:stomach|food|hungry)\*", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _replacement_pass(energy_state: Optional[str], sad: bool) -> Tuple[Optional[Pattern], Dict[str, str]]:
+    """
+    One alternation regex covering every rewrite for a state combination
+    
+    The tokens are all *word* actions, so none can overlap or produce another,
+    and a single left-to-right substitution matches chained str.replace calls.
+    """
+    replacements = dict(_ENERGY_REPLACEMENTS.get(energy_state, {}))
+    if sad:
+        replacements.update(_SAD_REPLACEMENTS)
+    if not replacements:
+        return None, replacements
+    pattern = re.compile("|".join(map(re.escape, replacements)))
+    return pattern, replacements
+
+
 class CreatureLanguage:
     """
     Generates creature-appropriate language based on emotional state and species type
@@ -21,6 +66,21 @@ class CreatureLanguage:
     def __init__(self, template: CreatureTemplate):
         self.template = template
         self.current_language = "en"  # Default language
+        
+        # The template's sound table is fixed for the creature's life, so the
+        # per-energy picks and fallback sounds are resolved once
+        sounds = template.language.sounds
+        self._sounds_by_emotion: Dict[str, Tuple[str, str, str]] = {
+            emotion: (
+                (options[0], options[len(options)//2], options[-1]) if options
+                else ("*tired sound*", "*neutral sound*", "*energetic sound*")
+            )
+            for emotion, options in sounds.items()
+        }
+        self._default_sounds = self._sounds_by_emotion.get("neutral", ("*quiet sound*",) * 3)
+        self._busy_sounds = tuple(sounds.get("confused", ("*thoughtful pause*",)))
+        self._confused_sounds = tuple(sounds.get("confused", ("*confused sound*",)))
+        self._rng = random.Random()
     
     def generate_response(
         self, 
@@ -63,91 +123,69 @@ class CreatureLanguage:
     
     def _get_emotion_sound(self, emotion: str, energy_level: float) -> str:
         """Get appropriate sound for emotion and energy level"""
-        
-        if emotion not in self.template.language.sounds:
-            emotion = "neutral"
-        
-        sounds = self.template.language.sounds.get(emotion, ["*quiet sound*"])
+        low, medium, high = self._sounds_by_emotion.get(emotion, self._default_sounds)
         
         # Select sound based on energy level
         if energy_level < 30:
             # Low energy - use first (typically quieter) sound
-            return sounds[0] if sounds else "*tired sound*"
+            return low
         elif energy_level > 70:
             # High energy - use last (typically more energetic) sound
-            return sounds[-1] if sounds else "*energetic sound*"
+            return high
         else:
-            # Medium energy - use middle or random sound
-            return sounds[len(sounds)//2] if sounds else "*neutral sound*"
+            # Medium energy - use middle sound
+            return medium
     
     def _apply_state_modifiers(self, base_response: str, creature_state: CreatureState) -> str:
         """Apply state-based modifications to the response"""
         
-        modified = base_response
         stats = creature_state.stats
         
         # Energy level modifications
         energy = stats.get("energy", 50)
         if energy < 20:
             # Very low energy - replace active actions with tired ones
-            modified = self._replace_energetic_actions(modified, "very_tired")
+            energy_state = "very_tired"
         elif energy < 40:
             # Low energy - replace some actions with tired alternatives
-            modified = self._replace_energetic_actions(modified, "tired")
+            energy_state = "tired"
+        else:
+            energy_state = None
         
         # Happiness modifications
-        happiness = stats.get("happiness", 50)
-        if happiness < 30:
+        sad = stats.get("happiness", 50) < 30
+        
+        # Energy and happiness rewrites share one pass over the text
+        pattern, replacements = _replacement_pass(energy_state, sad)
+        modified = pattern.sub(lambda m: replacements[m.group()], base_response) if pattern else base_response
+        
+        prefixes = ""
+        if sad and not _SAD_WORDS_RE.search(modified):
             # Low happiness - add sad elements
-            if "*happy*" in modified.lower():
-                modified = modified.replace("*happy*", "*subdued*")
-            if not any(sad_word in modified.lower() for sad_word in ["*droop*", "*whimper*", "*sad*"]):
-                modified = "*subdued demeanor* " + modified
+            prefixes = "*subdued demeanor* "
         
         # Hunger modifications
         hunger = stats.get("hunger", 50)
-        if hunger < 30:
+        if hunger < 30 and not _HUNGER_WORDS_RE.search(modified):
             # Very hungry - add hunger indicators
-            if not any(hunger_word in modified.lower() for hunger_word in ["*stomach*", "*food*", "*hungry*"]):
-                modified = "*stomach rumbles quietly* " + modified
+            prefixes = "*stomach rumbles quietly* " + prefixes
         
-        return modified
+        return prefixes + modified
     
     def _replace_energetic_actions(self, text: str, energy_state: str) -> str:
         """Replace energetic actions with tired alternatives"""
-        
-        if energy_state == "very_tired":
-            replacements = {
-                "*jump*": "*slow movement*",
-                "*bounce*": "*gentle sway*",
-                "*run*": "*slow walk*",
-                "*pounce*": "*careful approach*",
-                "*leap*": "*small step*",
-                "*excited*": "*weary*",
-                "*energetic*": "*tired*"
-            }
-        else:  # tired
-            replacements = {
-                "*jump*": "*small hop*",
-                "*bounce*": "*gentle movement*",
-                "*run*": "*trot*",
-                "*excited*": "*mildly interested*"
-            }
-        
-        for original, replacement in replacements.items():
-            text = text.replace(original, replacement)
-        
-        return text
+        if energy_state != "very_tired":
+            energy_state = "tired"
+        pattern, replacements = _replacement_pass(energy_state, False)
+        return pattern.sub(lambda m: replacements[m.group()], text)
     
     def get_busy_response(self) -> str:
         """Get a response when the creature mind is busy processing"""
-        busy_sounds = self.template.language.sounds.get("confused", ["*thoughtful pause*"])
-        return f"*processing* {random.choice(busy_sounds)}"
+        return f"*processing* {self._rng.choice(self._busy_sounds)}"
     
     def get_error_response(self) -> str:
         """Get a response when an error occurs"""
-        confused_sounds = self.template.language.sounds.get("confused", ["*confused sound*"])
-        return f"*tilted head* {random.choice(confused_sounds)}"
+        return f"*tilted head* {self._rng.choice(self._confused_sounds)}"
     
     def localize_for_language(self, text: str, language_code: str = None) -> str:
         """
@@ -4,10 +4,13 @@ Creature Model - Generalized from WiddlePupper's Dog.swift
 Represents any type of creature/character with configurable stats, personality, and behavior.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
 
 
@@ -24,6 +27,89 @@ class CreatureStats(BaseModel):
     values: Dict[str, float] = Field(default_factory=dict)
     configs: Dict[str, StatConfig] = Field(default_factory=dict)
     
+    # Struct-of-arrays view of the decaying stats, rebuilt when configs change
+    _names: List[str] = PrivateAttr(default_factory=list)
+    _idx: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _min_arr: np.ndarray = PrivateAttr(default_factory=lambda: np.empty(0))
+    _max_arr: np.ndarray = PrivateAttr(default_factory=lambda: np.empty(0))
+    _decay_arr: np.ndarray = PrivateAttr(default_factory=lambda: np.empty(0))
+    _default_arr: np.ndarray = PrivateAttr(default_factory=lambda: np.empty(0))
+    _layout_key: Optional[Tuple] = PrivateAttr(default=None)
+    
+    def _ensure_layout(self) -> None:
+        """Rebuild the per-stat arrays if configs was replaced or edited"""
+        # StatConfig is mutable, so key on the field values rather than identities
+        configs = self.configs
+        key = tuple(
+            (name, c.min_value, c.max_value, c.decay_rate, c.default_start)
+            for name, c in configs.items()
+        )
+        if key == self._layout_key:
+            return
+        
+        decaying = [(name, config) for name, config in configs.items() if config.decay_rate > 0]
+        self._names = [name for name, _ in decaying]
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        self._min_arr = np.array([c.min_value for _, c in decaying], dtype=np.float64)
+        self._max_arr = np.array([c.max_value for _, c in decaying], dtype=np.float64)
+        self._decay_arr = np.array([c.decay_rate for _, c in decaying], dtype=np.float64)
+        self._default_arr = np.array([c.default_start for _, c in decaying], dtype=np.float64)
+        self._layout_key = key
+    
+    def _gather_values(self) -> np.ndarray:
+        """Current values of the decaying stats, in layout order"""
+        values = self.values
+        return np.fromiter(
+            (values.get(name, default) for name, default in zip(self._names, self._default_arr.tolist())),
+            dtype=np.float64,
+            count=len(self._names)
+        )
+    
+    def decay(self, hours: float) -> None:
+        """Apply decay_rate * hours to every decaying stat, clamped to bounds"""
+        self._ensure_layout()
+        if not self._names:
+            return
+        
+        current = self._gather_values()
+        # Clamp first so out-of-range stored values decay from their bound
+        np.clip(current, self._min_arr, self._max_arr, out=current)
+        current -= self._decay_arr * hours
+        np.clip(current, self._min_arr, self._max_arr, out=current)
+        self.values.update(zip(self._names, current.tolist()))
+    
+    @classmethod
+    def batch_decay(cls, stats: Sequence["CreatureStats"],
+                    hours: Union[float, Sequence[float]]) -> None:
+        """
+        Decay many creatures' stats at once
+        
+        Stats sharing the same decaying stat names are stacked into one matrix
+        and clamped in a single vectorized pass. hours is either one value for
+        everyone or one value per entry in stats.
+        """
+        hours_arr = np.broadcast_to(np.asarray(hours, dtype=np.float64), (len(stats),))
+        
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for i, entry in enumerate(stats):
+            entry._ensure_layout()
+            if entry._names:
+                groups.setdefault(tuple(entry._names), []).append(i)
+        
+        for names, members in groups.items():
+            rows = [stats[i] for i in members]
+            current = np.stack([row._gather_values() for row in rows])
+            mins = np.stack([row._min_arr for row in rows])
+            maxs = np.stack([row._max_arr for row in rows])
+            rates = np.stack([row._decay_arr for row in rows])
+            
+            np.clip(current, mins, maxs, out=current)
+            current -= rates * hours_arr[members][:, None]
+            np.clip(current, mins, maxs, out=current)
+            
+            for row, updated in zip(rows, current.tolist()):
+                row.values.update(zip(names, updated))
+    
     def get_stat(self, stat_name: str) -> float:
         """Get a stat value, ensuring it's within bounds"""
         if stat_name not in self.values:
@@ -65,6 +151,33 @@ class Memory(BaseModel):
         return delta.total_seconds() / 3600
 
 
+class _MemoryList(list):
+    """
+    List of memories that counts its own mutations
+    
+    Indexes built over the list compare the count instead of rescanning every
+    entry. Edits to a Memory's own fields are not list mutations and are not seen.
+    """
+    version = 0
+
+
+def _counting(name: str):
+    method = getattr(list, name)
+    
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_MemoryList, _name, _counting(_name))
+del _name
+
+
 class CreaturePersonality(BaseModel):
     """Personality configuration for a creature"""
     traits: List[str] = Field(default_factory=list)
@@ -107,9 +220,61 @@ class Creature(BaseModel):
     learned_abilities: List[str] = Field(default_factory=list)
     ability_progress: Dict[str, float] = Field(default_factory=dict)
     
-    def update_interaction_time(self) -> None:
+    def tick(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Start processing a request at a single point in time
+        
+        Stamps the interaction and returns the clock reading so it can be passed
+        to update_stats_for_inactivity, get_recent_memories and
+        CreatureState.from_creature instead of each reading the clock again.
+        """
+        now = now or datetime.now()
+        self.update_interaction_time(now)
+        return now
+    
+    def update_interaction_time(self, now: Optional[datetime] = None) -> None:
         """Update the last interaction timestamp"""
-        self.last_interaction_time = datetime.now()
+        self.last_interaction_time = now or datetime.now()
+    
+    # Memories ordered by timestamp with parallel POSIX timestamp lists, overall
+    # and per type, so "last N hours" is a float bisect plus a slice
+    _memory_times: List[float] = PrivateAttr(default_factory=list)
+    _memories_sorted: List[Memory] = PrivateAttr(default_factory=list)
+    _memories_by_type: Dict[str, Tuple[List[float], List[Memory]]] = PrivateAttr(default_factory=dict)
+    # (list identity, mutation count) as of the last index build
+    _memory_index_key: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    
+    def _index_memory(self, memory: Memory) -> None:
+        """Insert one memory into the timestamp indexes, keeping them sorted"""
+        ts = memory.timestamp.timestamp()
+        for times, memories in (
+            (self._memory_times, self._memories_sorted),
+            self._memories_by_type.setdefault(memory.type, ([], []))
+        ):
+            if not times or ts >= times[-1]:
+                times.append(ts)
+                memories.append(memory)
+            else:
+                i = bisect_right(times, ts)
+                times.insert(i, ts)
+                memories.insert(i, memory)
+    
+    def _ensure_memory_index(self) -> None:
+        """Rebuild the indexes if memories was replaced or changed outside add_memory"""
+        if not isinstance(self.memories, _MemoryList):
+            self.memories = _MemoryList(self.memories)
+        key = (id(self.memories), self.memories.version)
+        if key == self._memory_index_key:
+            return
+        
+        self._memories_sorted = sorted(self.memories, key=lambda m: m.timestamp)
+        self._memory_times = [m.timestamp.timestamp() for m in self._memories_sorted]
+        self._memories_by_type = {}
+        for memory, ts in zip(self._memories_sorted, self._memory_times):
+            times, memories = self._memories_by_type.setdefault(memory.type, ([], []))
+            times.append(ts)
+            memories.append(memory)
+        self._memory_index_key = key
     
     def add_memory(self, memory_type: str, description: str, 
                    emotional_impact: float = 0.0, metadata: Dict[str, Any] = None) -> Memory:
@@ -120,30 +285,37 @@ class Creature(BaseModel):
             emotional_impact=emotional_impact,
             metadata=metadata or {}
         )
+        self._ensure_memory_index()
         self.memories.append(memory)
+        self._index_memory(memory)
+        self._memory_index_key = (id(self.memories), self.memories.version)
         return memory
     
-    def get_recent_memories(self, hours: float = 24, memory_type: str = None) -> List[Memory]:
+    def get_recent_memories(self, hours: float = 24, memory_type: str = None,
+                            now: Optional[datetime] = None) -> List[Memory]:
         """Get memories from the last N hours, optionally filtered by type"""
-        cutoff = datetime.now() - timedelta(hours=hours)
-        recent = [m for m in self.memories if m.timestamp > cutoff and not m.is_expired]
+        self._ensure_memory_index()
+        now = now or datetime.now()
+        cutoff = now.timestamp() - hours * 3600
         
         if memory_type:
-            recent = [m for m in recent if m.type == memory_type]
+            times, memories = self._memories_by_type.get(memory_type, ((), ()))
+        else:
+            times, memories = self._memory_times, self._memories_sorted
         
-        return sorted(recent, key=lambda m: m.timestamp, reverse=True)
+        start = bisect_right(times, cutoff)
+        return [
+            m for m in reversed(memories[start:])
+            if m.expiration_date is None or now <= m.expiration_date
+        ]
     
-    def update_stats_for_inactivity(self) -> None:
+    def update_stats_for_inactivity(self, now: Optional[datetime] = None) -> None:
         """Apply stat decay based on time since last interaction"""
-        now = datetime.now()
+        now = now or datetime.now()
         hours_inactive = (now - self.last_interaction_time).total_seconds() / 3600
         
         # Apply decay to all configured stats
-        for stat_name, config in self.stats.configs.items():
-            if config.decay_rate > 0:
-                decay_amount = config.decay_rate * hours_inactive
-                current = self.stats.get_stat(stat_name)
-                self.stats.set_stat(stat_name, current - decay_amount)
+        self.stats.decay(hours_inactive)
         
         self.last_stats_update = now
     
@@ -196,8 +368,14 @@ class Creature(BaseModel):
             return "neutral"
 
 
-class CreatureState(BaseModel):
-    """Snapshot of a creature's current state for agent processing"""
+@dataclass(slots=True)
+class CreatureState:
+    """
+    Snapshot of a creature's current state for agent processing
+    
+    Built by trusted code once per request, so it is a plain dataclass rather
+    than a validated Pydantic model.
+    """
     creature_id: UUID
     stats: Dict[str, float]
     mood: str
@@ -207,19 +385,34 @@ class CreatureState(BaseModel):
     species: str
     template_id: str
     
+    # "- Name: " prefix per stat, built once per snapshot
+    _stat_labels: Dict[str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._stat_labels = {name: f"- {name.title()}: " for name in self.stats}
+    
+    def stats_summary(self) -> str:
+        """Stats as "- Name: value/100" lines for agent prompts"""
+        labels = self._stat_labels
+        return "\n".join(
+            f"{labels.get(name) or f'- {name.title()}: '}{value}/100"
+            for name, value in self.stats.items()
+        )
+    
     @classmethod
-    def from_creature(cls, creature: Creature) -> "CreatureState":
+    def from_creature(cls, creature: Creature, now: Optional[datetime] = None) -> "CreatureState":
         """Create a state snapshot from a creature"""
-        now = datetime.now()
+        now = now or datetime.now()
         hours_since_interaction = (now - creature.last_interaction_time).total_seconds() / 3600
         
+        get_stat = creature.stats.get_stat
         return cls(
-            creature_id=creature.id,
-            stats={name: creature.stats.get_stat(name) for name in creature.stats.configs.keys()},
-            mood=creature.get_mood_description(),
-            last_interaction_hours=hours_since_interaction,
-            recent_memories=creature.get_recent_memories(hours=12),
-            personality_traits=creature.personality.traits,
-            species=creature.species,
-            template_id=creature.template_id
+            creature.id,
+            {name: get_stat(name) for name in creature.stats.configs},
+            creature.get_mood_description(),
+            hours_since_interaction,
+            creature.get_recent_memories(hours=12, now=now),
+            creature.personality.traits,
+            creature.species,
+            creature.template_id
         )
\ No newline at end of file
@@ -5,32 +5,70 @@ Defines the configuration templates that determine how different creature types
 what stats they have, what sounds they make, etc.
 """
 
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+import functools
+import operator
+from dataclasses import dataclass, field
+from random import Random
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class LanguageConfig(BaseModel):
+# Translation requirement prefixes and their comparisons, two-character operators first
+_CONDITION_OPS = (
+    (">=", operator.ge),
+    ("<=", operator.le),
+    (">", operator.gt),
+    ("<", operator.lt),
+    ("=", operator.eq),
+)
+
+# Sound variety only, so one unseeded generator is shared by all templates
+_RNG = Random()
+
+# Sound pick used when neither the emotion nor "neutral" has sounds
+_DEFAULT_SOUND_PICK = ("*quiet sound*", "*quiet sound*", ["*quiet sound*"])
+
+
+def compile_conditions(raw: Dict[str, str]) -> List[Tuple[str, Callable[[float, float], bool], float]]:
+    """
+    Parse translation requirements such as "> 50" or ">= 30" once
+
+    Returns (stat, comparison, threshold) tuples; requirements without a known
+    operator are dropped, as they never restricted translation.
+    """
+    compiled = []
+    for stat, requirement in raw.items():
+        for prefix, op in _CONDITION_OPS:
+            if requirement.startswith(prefix):
+                compiled.append((stat, op, float(requirement[len(prefix):].strip())))
+                break
+    return compiled
+
+
+@dataclass(slots=True)
+class LanguageConfig:
     """Configuration for creature language/sounds"""
     # Sound mappings for different emotional states/actions
-    sounds: Dict[str, List[str]] = Field(default_factory=dict)
+    sounds: Dict[str, List[str]] = field(default_factory=dict)
     
     # Cultural variations (e.g., different bark sounds in different languages)
-    cultural_sounds: Dict[str, Dict[str, str]] = Field(default_factory=dict)
+    cultural_sounds: Dict[str, Dict[str, str]] = field(default_factory=dict)
     
     # Conditions that must be met for human translation to be available
-    translation_conditions: Dict[str, str] = Field(default_factory=dict)
+    translation_conditions: Dict[str, str] = field(default_factory=dict)
     
     # Behavioral patterns specific to this creature type
-    behavioral_patterns: List[str] = Field(default_factory=list)
+    behavioral_patterns: List[str] = field(default_factory=list)
 
 
-class ActivityConfig(BaseModel):
+@dataclass(slots=True)
+class ActivityConfig:
     """Configuration for activities this creature type can perform"""
     name: str
-    stat_effects: Dict[str, float] = Field(default_factory=dict)
+    stat_effects: Dict[str, float] = field(default_factory=dict)
     energy_cost: float = 0
     description: str = ""
-    required_stats: Dict[str, float] = Field(default_factory=dict)
+    required_stats: Dict[str, float] = field(default_factory=dict)
 
 
 class CreatureTemplate(BaseModel):
@@ -40,6 +78,10 @@ class CreatureTemplate(BaseModel):
     This is the configuration that makes a "dog" different from a "dragon"
     """
     
+    # Templates are shared by every creature of the type; freezing them keeps
+    # the cached properties below valid
+    model_config = ConfigDict(frozen=True)
+    
     # Basic identification
     id: str  # e.g., "loyal_dog", "ancient_dragon", "playful_cat"
     name: str  # Human-readable name
@@ -69,31 +111,52 @@ class CreatureTemplate(BaseModel):
     emotion_prompt_additions: str = ""
     decision_prompt_additions: str = ""
     
+    @functools.cached_property
+    def compiled_translation_conditions(self) -> List[Tuple[str, Callable[[float, float], bool], float]]:
+        """translation_conditions as (stat, comparison, threshold), parsed once per template"""
+        return compile_conditions(self.language.translation_conditions)
+    
+    @functools.cached_property
+    def sounds_summary(self) -> str:
+        """One "emotion: sound, sound" line per emotion, built once per template"""
+        return "\n".join(
+            f"{emotion}: {', '.join(sounds)}" for emotion, sounds in self.language.sounds.items()
+        )
+    
+    @functools.cached_property
+    def default_stats(self) -> Dict[str, float]:
+        """Default starting value per stat, built once per template"""
+        return {
+            stat_name: config.get("default_start", 75)
+            for stat_name, config in self.stat_configs.items()
+        }
+    
+    @functools.cached_property
+    def sound_pick_table(self) -> Dict[str, Tuple[str, str, List[str]]]:
+        """emotion -> (low energy sound, high energy sound, all sounds), built once per template"""
+        return {
+            emotion: (sounds[0], sounds[-1], sounds) if sounds
+            else ("*tired sound*", "*energetic sound*", sounds)
+            for emotion, sounds in self.language.sounds.items()
+        }
+    
     def get_default_stats(self) -> Dict[str, float]:
         """Get the default starting stats for this creature type"""
-        defaults = {}
-        for stat_name, config in self.stat_configs.items():
-            defaults[stat_name] = config.get("default_start", 75)
-        return defaults
+        return dict(self.default_stats)
     
     def get_sound_for_emotion(self, emotion: str, energy_level: float = 50) -> str:
         """Get an appropriate sound for the given emotion and energy level"""
-        if emotion not in self.language.sounds:
-            emotion = "neutral"
-        
-        sounds = self.language.sounds.get(emotion, ["*quiet sound*"])
+        table = self.sound_pick_table
+        entry = table.get(emotion) or table.get("neutral") or _DEFAULT_SOUND_PICK
+        low, high, sounds = entry
         
-        # Simple energy-based selection (could be more sophisticated)
+        # Low energy: first (typically quieter) sound; high energy: last (more
+        # energetic) sound; in between, a random one
         if energy_level < 30:
-            # Use first sound (typically quieter/more tired)
-            return sounds[0] if sounds else "*tired sound*"
-        elif energy_level > 70:
-            # Use last sound (typically more energetic)
-            return sounds[-1] if sounds else "*energetic sound*"
-        else:
-            # Use middle sound or random
-            import random
-            return random.choice(sounds) if sounds else "*neutral sound*"
+            return low
+        if energy_level > 70:
+            return high
+        return sounds[_RNG.randrange(len(sounds))] if sounds else "*neutral sound*"
     
     def can_learn_ability(self, ability: str) -> bool:
         """Check if this creature type can learn the given ability"""
@@ -106,9 +169,10 @@ class CreatureTemplate(BaseModel):
         return self.ability_difficulty.get(ability, 3)  # Default medium difficulty
 
 
-# Predefined base templates that can be extended
+# Predefined base templates that can be extended; the literals below are
+# trusted, so they are built with model_construct and skip validation
 BASE_TEMPLATES = {
-    "mammal": CreatureTemplate(
+    "mammal": CreatureTemplate.model_construct(
         id="base_mammal",
         name="Base Mammal",
         species="mammal",
@@ -132,7 +196,7 @@ BASE_TEMPLATES = {
         )
     ),
     
-    "reptile": CreatureTemplate(
+    "reptile": CreatureTemplate.model_construct(
         id="base_reptile", 
         name="Base Reptile",
         species="reptile",
@@ -155,7 +219,7 @@ BASE_TEMPLATES = {
         )
     ),
     
-    "mythical": CreatureTemplate(
+    "mythical": CreatureTemplate.model_construct(
         id="base_mythical",
         name="Base Mythical Creature", 
         species="mythical",
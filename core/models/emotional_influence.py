@@ -6,19 +6,223 @@ to temporarily exhibit different personality characteristics based on their curr
 emotional state. This creates more dynamic and realistic personality expression.
 """
 
+import types
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from pydantic import BaseModel, Field
 from enum import Enum
+from .personality_system import TRAIT_NAME_TO_INDEX
 
+# Numba is optional (pip install numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
 
-class EmotionalInfluence(BaseModel):
-    """Represents how an emotional state influences personality traits"""
-    emotion: str
-    trait_influences: Dict[str, float]  # trait_name -> influence_strength (-1.0 to 1.0)
-    intensity_multiplier: float = 1.0  # How much emotion intensity affects the influence
-    duration_decay: float = 0.9  # How quickly influence fades over time
+
+def _add_scaled_loops(out, idx, vals, scale):
+    """out[idx] += vals * scale as one loop, fused by the JIT"""
+    for i in range(idx.shape[0]):
+        out[idx[i]] += vals[i] * scale
+
+
+if NUMBA_AVAILABLE:
+    add_scaled_influence = njit(cache=True, fastmath=True)(_add_scaled_loops)
+else:
+    add_scaled_influence = None
+
+
+# Shared read-only tables for emotions without trait influences
+_NO_INDICES = np.empty(0, dtype=np.int32)
+_NO_INDICES.setflags(write=False)
+_NO_VALUES = np.empty(0, dtype=np.float64)
+_NO_VALUES.setflags(write=False)
+
+# Emotion -> trait influences, based on psychological research
+_EMOTIONAL_INFLUENCE_MAP = {
+    'happy': {
+        'extraversion': 0.4,
+        'optimism': 0.6,
+        'sociability': 0.5,
+        'enthusiasm': 0.7,
+        'confidence': 0.3,
+        'agreeableness': 0.4,
+        'emotional_expressiveness': 0.5,
+        'neuroticism': -0.3
+    },
+    'sad': {
+        'extraversion': -0.5,
+        'optimism': -0.7,
+        'sociability': -0.4,
+        'enthusiasm': -0.6,
+        'confidence': -0.4,
+        'neuroticism': 0.4,
+        'empathy': 0.3,
+        'reflectiveness': 0.4
+    },
+    'angry': {
+        'agreeableness': -0.6,
+        'assertiveness': 0.7,
+        'neuroticism': 0.5,
+        'emotional_expressiveness': 0.6,
+        'patience': -0.8,
+        'tolerance': -0.5,
+        'risk_taking': 0.4,
+        'competitiveness': 0.5
+    },
+    'anxious': {
+        'neuroticism': 0.8,
+        'caution': 0.7,
+        'confidence': -0.5,
+        'risk_taking': -0.6,
+        'emotional_stability': -0.6,
+        'independence': -0.3,
+        'trust': -0.4,
+        'social_anxiety': 0.6
+    },
+    'excited': {
+        'enthusiasm': 0.8,
+        'extraversion': 0.6,
+        'energy': 0.7,
+        'optimism': 0.5,
+        'risk_taking': 0.4,
+        'sociability': 0.6,
+        'spontaneity': 0.7,
+        'patience': -0.4
+    },
+    'calm': {
+        'emotional_stability': 0.6,
+        'patience': 0.5,
+        'neuroticism': -0.5,
+        'reflectiveness': 0.4,
+        'focus': 0.3,
+        'self_control': 0.4,
+        'mindfulness': 0.6
+    },
+    'fearful': {
+        'caution': 0.8,
+        'neuroticism': 0.6,
+        'risk_taking': -0.7,
+        'confidence': -0.5,
+        'independence': -0.4,
+        'trust': -0.3,
+        'boldness': -0.6
+    },
+    'curious': {
+        'curiosity': 0.7,
+        'openness': 0.6,
+        'innovativeness': 0.5,
+        'intellectual_curiosity': 0.8,
+        'exploration': 0.6,
+        'focus': 0.4
+    },
+    'content': {
+        'emotional_stability': 0.5,
+        'optimism': 0.4,
+        'patience': 0.4,
+        'agreeableness': 0.3,
+        'neuroticism': -0.4,
+        'satisfaction': 0.6
+    },
+    'frustrated': {
+        'patience': -0.7,
+        'neuroticism': 0.5,
+        'agreeableness': -0.4,
+        'emotional_stability': -0.5,
+        'perseverance': -0.3,
+        'assertiveness': 0.4
+    },
+    'lonely': {
+        'sociability': -0.5,
+        'extraversion': -0.4,
+        'neuroticism': 0.4,
+        'empathy': 0.3,
+        'independence': -0.6,
+        'emotional_expressiveness': -0.3
+    },
+    'proud': {
+        'confidence': 0.6,
+        'self_efficacy': 0.5,
+        'humility': -0.4,
+        'assertiveness': 0.4,
+        'optimism': 0.4,
+        'ambition': 0.3
+    }
+}
+
+
+def _compile_influence_tables(influence_map: Dict[str, Dict[str, float]]) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """Split each emotion's trait influences into index and value arrays, dropping unknown traits"""
+    emotion_idx = {}
+    emotion_val = {}
+    for emotion, influences in influence_map.items():
+        known = [(TRAIT_NAME_TO_INDEX[name], value) for name, value in influences.items()
+                 if name in TRAIT_NAME_TO_INDEX]
+        emotion_idx[emotion] = np.array([i for i, _ in known], dtype=np.int32)
+        emotion_val[emotion] = np.array([v for _, v in known], dtype=np.float64)
+    
+    # The default primary emotion has no influences; map it explicitly
+    emotion_idx.setdefault('neutral', _NO_INDICES)
+    emotion_val.setdefault('neutral', _NO_VALUES)
+    return emotion_idx, emotion_val
+
+
+# Trait names resolved to indices once at import; the hot path never hashes them
+_EMOTION_IDX, _EMOTION_VAL = _compile_influence_tables(_EMOTIONAL_INFLUENCE_MAP)
+
+# Behavioral prediction mappings per primary emotion
+_BEHAVIOR_PREDICTIONS = types.MappingProxyType({
+    'happy': {
+        'social_tendency': 'increased',
+        'risk_taking': 'slightly_increased',
+        'cooperation': 'increased',
+        'energy_level': 'high',
+        'decision_making': 'optimistic_bias'
+    },
+    'sad': {
+        'social_tendency': 'decreased',
+        'risk_taking': 'decreased',
+        'cooperation': 'neutral_to_decreased',
+        'energy_level': 'low',
+        'decision_making': 'pessimistic_bias'
+    },
+    'angry': {
+        'social_tendency': 'confrontational',
+        'risk_taking': 'increased',
+        'cooperation': 'decreased',
+        'energy_level': 'high',
+        'decision_making': 'aggressive_bias'
+    },
+    'anxious': {
+        'social_tendency': 'avoidant',
+        'risk_taking': 'strongly_decreased',
+        'cooperation': 'cautious',
+        'energy_level': 'medium_to_high',
+        'decision_making': 'overly_cautious'
+    },
+    'excited': {
+        'social_tendency': 'very_increased',
+        'risk_taking': 'increased',
+        'cooperation': 'enthusiastic',
+        'energy_level': 'very_high',
+        'decision_making': 'impulsive_tendency'
+    },
+    'calm': {
+        'social_tendency': 'balanced',
+        'risk_taking': 'measured',
+        'cooperation': 'steady',
+        'energy_level': 'stable',
+        'decision_making': 'rational'
+    }
+})
+
+# Intensity modifier for low (< 0.3), medium (< 0.7) and high intensity
+_INTENSITY_MODIFIERS = (0.3, 0.7, 1.0)
+
+# Quantized trait storage maps 0..255 onto 0.0..1.0
+_TRAIT_QUANT_LEVELS = 255.0
 
 
 class EmotionalPersonalityModifier:
@@ -30,10 +234,20 @@ class EmotionalPersonalityModifier:
     personality remains stable.
     """
     
+    __slots__ = (
+        "emotional_influences", "max_influence_strength", "influence_decay_rate",
+        "emotion_threshold", "_emotion_idx", "_emotion_val", "_trait_idx"
+    )
+    
     def __init__(self):
-        # Emotional influence mappings based on psychological research
+        self._trait_idx = TRAIT_NAME_TO_INDEX
+        
+        # Emotional influence mappings, kept by name for introspection
         self.emotional_influences = self._build_emotional_influence_map()
         
+        # Same mappings as parallel (trait index, influence) arrays per emotion
+        self._emotion_idx, self._emotion_val = _EMOTION_IDX, _EMOTION_VAL
+        
         # Settings for emotional influence dynamics
         self.max_influence_strength = 0.3  # Maximum trait modification from emotions
         self.influence_decay_rate = 0.95  # How quickly emotional influences fade
@@ -42,7 +256,8 @@ class EmotionalPersonalityModifier:
     def apply_emotional_influence(self,
                                  base_trait_vector: np.ndarray,
                                  emotional_state: Dict[str, Any],
-                                 previous_influences: Optional[Dict[str, float]] = None) -> np.ndarray:
+                                 previous_influences: Optional[Dict[str, float]] = None,
+                                 out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply current emotional state influences to personality traits
         
@@ -50,13 +265,17 @@ class EmotionalPersonalityModifier:
             base_trait_vector: Base 50-dimensional personality vector
             emotional_state: Current emotional state information
             previous_influences: Previously applied influences (for decay)
+            out: Optional preallocated buffer shaped like base_trait_vector; it is
+                overwritten and returned instead of allocating a new vector
             
         Returns:
             Modified trait vector with emotional influences applied
         """
-        from ..models.personality_system import TRAIT_NAME_TO_INDEX
-        
-        modified_vector = base_trait_vector.copy()
+        if out is None:
+            modified_vector = base_trait_vector.copy()
+        else:
+            np.copyto(out, base_trait_vector)
+            modified_vector = out
         
         # Extract emotional state information
         primary_emotion = emotional_state.get('primary_emotion', 'neutral')
@@ -68,47 +287,100 @@ class EmotionalPersonalityModifier:
         if intensity < self.emotion_threshold:
             return modified_vector
         
-        # Get influence mapping for this emotion
-        influence_map = self.emotional_influences.get(primary_emotion, {})
+        max_strength = self.max_influence_strength
+        emotion_idx = self._emotion_idx
+        emotion_val = self._emotion_val
         
         # Apply emotional influences
-        for trait_name, base_influence in influence_map.items():
-            trait_index = TRAIT_NAME_TO_INDEX.get(trait_name)
-            if trait_index is not None:
-                # Calculate total influence strength
-                influence_strength = base_influence * intensity * self.max_influence_strength
-                
-                # Apply valence modifier (positive emotions enhance positive traits)
-                if valence != 0:
-                    influence_strength *= (1.0 + valence * 0.5)
-                
-                # Apply duration modifier (sustained emotions have stronger influence)
-                duration_modifier = min(1.0 + (duration_hours / 24.0) * 0.5, 2.0)
-                influence_strength *= duration_modifier
-                
-                # Apply the influence
-                modified_vector[trait_index] += influence_strength
+        if emotion_idx.get(primary_emotion, _NO_INDICES).size:
+            # Calculate total influence strength
+            scale = intensity * max_strength
+            
+            # Apply valence modifier (positive emotions enhance positive traits)
+            scale *= (1.0 + valence * 0.5)
+            
+            # Apply duration modifier (sustained emotions have stronger influence)
+            scale *= min(1.0 + (duration_hours / 24.0) * 0.5, 2.0)
+            
+            if NUMBA_AVAILABLE:
+                add_scaled_influence(modified_vector, emotion_idx[primary_emotion],
+                                     emotion_val[primary_emotion], scale)
+            else:
+                # Trait indices are unique per emotion, so a fancy-index add is safe
+                modified_vector[emotion_idx[primary_emotion]] += emotion_val[primary_emotion] * scale
         
         # Apply secondary emotional influences (emotional combinations)
         secondary_emotions = emotional_state.get('secondary_emotions', [])
+        secondary_scale = intensity * max_strength * 0.5  # Secondary emotions have reduced influence
         for emotion in secondary_emotions:
-            secondary_influence_map = self.emotional_influences.get(emotion, {})
-            for trait_name, base_influence in secondary_influence_map.items():
-                trait_index = TRAIT_NAME_TO_INDEX.get(trait_name)
-                if trait_index is not None:
-                    # Secondary emotions have reduced influence
-                    influence_strength = base_influence * intensity * self.max_influence_strength * 0.5
-                    modified_vector[trait_index] += influence_strength
+            idx = emotion_idx.get(emotion, _NO_INDICES)
+            if not idx.size:
+                continue
+            if NUMBA_AVAILABLE:
+                add_scaled_influence(modified_vector, idx, emotion_val[emotion], secondary_scale)
+            else:
+                modified_vector[idx] += emotion_val[emotion] * secondary_scale
         
         # Apply decay to previous influences if provided
         if previous_influences:
             self._apply_influence_decay(modified_vector, previous_influences)
         
         # Ensure traits stay within bounds
-        modified_vector = np.clip(modified_vector, 0.0, 1.0)
+        np.clip(modified_vector, 0.0, 1.0, out=modified_vector)
         
         return modified_vector
 
+    def apply_emotional_influence_batch(self,
+                                        trait_matrix: np.ndarray,
+                                        emotions: List[str],
+                                        intensities: np.ndarray,
+                                        valences: np.ndarray,
+                                        durations: np.ndarray) -> np.ndarray:
+        """
+        Apply primary emotional influences to many creatures at once
+        
+        Args:
+            trait_matrix: (N, 50) base personality vectors, one row per creature.
+                A uint8 matrix is read as quantized traits (0-255 for 0.0-1.0).
+            emotions: Primary emotion per creature
+            intensities, valences, durations: Per-creature emotional state, shape (N,)
+            
+        Returns:
+            New (N, 50) matrix. Rows match apply_emotional_influence for a state
+            without secondary emotions or previous influences. Quantized input
+            is decoded for the computation and returned quantized.
+        """
+        quantized = isinstance(trait_matrix, np.ndarray) and trait_matrix.dtype == np.uint8
+        if quantized:
+            modified = trait_matrix * (1.0 / _TRAIT_QUANT_LEVELS)
+        else:
+            modified = np.array(trait_matrix, dtype=np.float64)
+        intensities = np.asarray(intensities, dtype=np.float64)
+        valences = np.asarray(valences, dtype=np.float64)
+        durations = np.asarray(durations, dtype=np.float64)
+        emotions = np.asarray(emotions)
+        
+        # Same scale as the single-creature path, for every row at once
+        scales = intensities * self.max_influence_strength
+        scales *= 1.0 + valences * 0.5
+        scales *= np.minimum(1.0 + (durations / 24.0) * 0.5, 2.0)
+        
+        # Rows below the threshold are returned untouched (and unclipped)
+        active = intensities >= self.emotion_threshold
+        
+        for emotion in np.unique(emotions[active]):
+            idx = self._emotion_idx.get(emotion, _NO_INDICES)
+            if not idx.size:
+                continue
+            rows = np.flatnonzero(active & (emotions == emotion))
+            modified[np.ix_(rows, idx)] += scales[rows, None] * self._emotion_val[emotion][None, :]
+        
+        modified[active] = np.clip(modified[active], 0.0, 1.0)
+        
+        if quantized:
+            return np.rint(modified * _TRAIT_QUANT_LEVELS).astype(np.uint8)
+        return modified
+
     def get_emotional_personality_summary(self,
                                          base_traits: Dict[str, float],
                                          modified_traits: Dict[str, float],
@@ -129,8 +401,11 @@ class EmotionalPersonalityModifier:
                     change_type = "increased" if change > 0 else "decreased"
                     significant_changes.append(f"{trait_name} {change_type} by {abs(change):.2f}")
         
+        # Significant deltas as one contiguous array for the pattern statistics
+        deltas = np.fromiter(trait_changes.values(), dtype=np.float64, count=len(trait_changes))
+        
         # Determine overall emotional influence pattern
-        influence_pattern = self._analyze_influence_pattern(trait_changes, emotional_state)
+        influence_pattern = self._analyze_influence_pattern(deltas, emotional_state)
         
         return {
             "primary_emotion": emotional_state.get('primary_emotion', 'neutral'),
@@ -139,7 +414,7 @@ class EmotionalPersonalityModifier:
             "significant_changes": significant_changes,
             "influence_pattern": influence_pattern,
             "temporary_personality_shift": len(significant_changes) > 0,
-            "emotional_dominance": self._calculate_emotional_dominance(trait_changes)
+            "emotional_dominance": self._calculate_emotional_dominance(deltas)
         }
 
     def predict_emotional_behavior(self,
@@ -153,203 +428,39 @@ class EmotionalPersonalityModifier:
         primary_emotion = emotional_state.get('primary_emotion', 'neutral')
         intensity = emotional_state.get('intensity', 0.0)
         
-        # Behavioral prediction mappings
-        behavior_predictions = {
-            'happy': {
-                'social_tendency': 'increased',
-                'risk_taking': 'slightly_increased',
-                'cooperation': 'increased',
-                'energy_level': 'high',
-                'decision_making': 'optimistic_bias'
-            },
-            'sad': {
-                'social_tendency': 'decreased',
-                'risk_taking': 'decreased',
-                'cooperation': 'neutral_to_decreased',
-                'energy_level': 'low',
-                'decision_making': 'pessimistic_bias'
-            },
-            'angry': {
-                'social_tendency': 'confrontational',
-                'risk_taking': 'increased',
-                'cooperation': 'decreased',
-                'energy_level': 'high',
-                'decision_making': 'aggressive_bias'
-            },
-            'anxious': {
-                'social_tendency': 'avoidant',
-                'risk_taking': 'strongly_decreased',
-                'cooperation': 'cautious',
-                'energy_level': 'medium_to_high',
-                'decision_making': 'overly_cautious'
-            },
-            'excited': {
-                'social_tendency': 'very_increased',
-                'risk_taking': 'increased',
-                'cooperation': 'enthusiastic',
-                'energy_level': 'very_high',
-                'decision_making': 'impulsive_tendency'
-            },
-            'calm': {
-                'social_tendency': 'balanced',
-                'risk_taking': 'measured',
-                'cooperation': 'steady',
-                'energy_level': 'stable',
-                'decision_making': 'rational'
-            }
-        }
-        
-        base_prediction = behavior_predictions.get(primary_emotion, behavior_predictions['calm'])
+        base_prediction = _BEHAVIOR_PREDICTIONS.get(primary_emotion, _BEHAVIOR_PREDICTIONS['calm'])
         
         # Modify predictions based on intensity
-        intensity_modifier = {
-            'low': 0.3,
-            'medium': 0.7,
-            'high': 1.0,
-            'very_high': 1.3
-        }
-        
-        intensity_level = 'low' if intensity < 0.3 else ('medium' if intensity < 0.7 else 'high')
-        modifier = intensity_modifier[intensity_level]
+        modifier = _INTENSITY_MODIFIERS[(intensity >= 0.3) + (intensity >= 0.7)]
         
         # Apply base personality influences
-        prediction = base_prediction.copy()
-        prediction['intensity_modifier'] = modifier
-        prediction['personality_context'] = self._apply_personality_context(base_prediction, base_personality)
-        
-        return prediction
+        return {
+            **base_prediction,
+            'intensity_modifier': modifier,
+            'personality_context': self._apply_personality_context(base_prediction, base_personality)
+        }
 
     def _build_emotional_influence_map(self) -> Dict[str, Dict[str, float]]:
         """Build mapping of emotions to trait influences"""
-        return {
-            'happy': {
-                'extraversion': 0.4,
-                'optimism': 0.6,
-                'sociability': 0.5,
-                'enthusiasm': 0.7,
-                'confidence': 0.3,
-                'agreeableness': 0.4,
-                'emotional_expressiveness': 0.5,
-                'neuroticism': -0.3
-            },
-            'sad': {
-                'extraversion': -0.5,
-                'optimism': -0.7,
-                'sociability': -0.4,
-                'enthusiasm': -0.6,
-                'confidence': -0.4,
-                'neuroticism': 0.4,
-                'empathy': 0.3,
-                'reflectiveness': 0.4
-            },
-            'angry': {
-                'agreeableness': -0.6,
-                'assertiveness': 0.7,
-                'neuroticism': 0.5,
-                'emotional_expressiveness': 0.6,
-                'patience': -0.8,
-                'tolerance': -0.5,
-                'risk_taking': 0.4,
-                'competitiveness': 0.5
-            },
-            'anxious': {
-                'neuroticism': 0.8,
-                'caution': 0.7,
-                'confidence': -0.5,
-                'risk_taking': -0.6,
-                'emotional_stability': -0.6,
-                'independence': -0.3,
-                'trust': -0.4,
-                'social_anxiety': 0.6
-            },
-            'excited': {
-                'enthusiasm': 0.8,
-                'extraversion': 0.6,
-                'energy': 0.7,
-                'optimism': 0.5,
-                'risk_taking': 0.4,
-                'sociability': 0.6,
-                'spontaneity': 0.7,
-                'patience': -0.4
-            },
-            'calm': {
-                'emotional_stability': 0.6,
-                'patience': 0.5,
-                'neuroticism': -0.5,
-                'reflectiveness': 0.4,
-                'focus': 0.3,
-                'self_control': 0.4,
-                'mindfulness': 0.6
-            },
-            'fearful': {
-                'caution': 0.8,
-                'neuroticism': 0.6,
-                'risk_taking': -0.7,
-                'confidence': -0.5,
-                'independence': -0.4,
-                'trust': -0.3,
-                'boldness': -0.6
-            },
-            'curious': {
-                'curiosity': 0.7,
-                'openness': 0.6,
-                'innovativeness': 0.5,
-                'intellectual_curiosity': 0.8,
-                'exploration': 0.6,
-                'focus': 0.4
-            },
-            'content': {
-                'emotional_stability': 0.5,
-                'optimism': 0.4,
-                'patience': 0.4,
-                'agreeableness': 0.3,
-                'neuroticism': -0.4,
-                'satisfaction': 0.6
-            },
-            'frustrated': {
-                'patience': -0.7,
-                'neuroticism': 0.5,
-                'agreeableness': -0.4,
-                'emotional_stability': -0.5,
-                'perseverance': -0.3,
-                'assertiveness': 0.4
-            },
-            'lonely': {
-                'sociability': -0.5,
-                'extraversion': -0.4,
-                'neuroticism': 0.4,
-                'empathy': 0.3,
-                'independence': -0.6,
-                'emotional_expressiveness': -0.3
-            },
-            'proud': {
-                'confidence': 0.6,
-                'self_efficacy': 0.5,
-                'humility': -0.4,
-                'assertiveness': 0.4,
-                'optimism': 0.4,
-                'ambition': 0.3
-            }
-        }
+        return _EMOTIONAL_INFLUENCE_MAP
 
     def _apply_influence_decay(self, trait_vector: np.ndarray, previous_influences: Dict[str, float]):
         """Apply decay to previous emotional influences"""
-        from ..models.personality_system import TRAIT_NAME_TO_INDEX
-        
+        trait_idx = self._trait_idx
         for trait_name, previous_influence in previous_influences.items():
-            trait_index = TRAIT_NAME_TO_INDEX.get(trait_name)
+            trait_index = trait_idx.get(trait_name)
             if trait_index is not None:
                 # Apply decay to previous influence
                 decayed_influence = previous_influence * self.influence_decay_rate
                 trait_vector[trait_index] += decayed_influence
 
-    def _analyze_influence_pattern(self, trait_changes: Dict[str, float], emotional_state: Dict[str, Any]) -> str:
-        """Analyze the overall pattern of emotional influence"""
-        if not trait_changes:
+    def _analyze_influence_pattern(self, deltas: np.ndarray, emotional_state: Dict[str, Any]) -> str:
+        """Analyze the overall pattern of emotional influence from significant trait deltas"""
+        if not deltas.size:
             return "stable"
         
-        increases = sum(1 for change in trait_changes.values() if change > 0)
-        decreases = sum(1 for change in trait_changes.values() if change < 0)
+        increases = int(np.count_nonzero(deltas > 0))
+        decreases = int(np.count_nonzero(deltas < 0))
         
         primary_emotion = emotional_state.get('primary_emotion', 'neutral')
         intensity = emotional_state.get('intensity', 0.0)
@@ -363,13 +474,12 @@ class EmotionalPersonalityModifier:
         else:
             return f"mixed_{primary_emotion}_influence"
 
-    def _calculate_emotional_dominance(self, trait_changes: Dict[str, float]) -> float:
+    def _calculate_emotional_dominance(self, deltas: np.ndarray) -> float:
         """Calculate how much emotions are dominating personality expression"""
-        if not trait_changes:
+        if not deltas.size:
             return 0.0
         
-        total_change = sum(abs(change) for change in trait_changes.values())
-        return min(total_change / len(trait_changes), 1.0)
+        return min(float(np.abs(deltas).mean()), 1.0)
 
     def _apply_personality_context(self, base_prediction: Dict[str, str], base_personality: Dict[str, float]) -> Dict[str, Any]:
         """Apply base personality context to behavioral predictions"""
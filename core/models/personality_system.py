@@ -8,6 +8,7 @@ Implements a dual-mode personality system:
 Based on "Trait-driven Decision Model for LLM-Wrapped Agent Conversations"
 """
 
+import functools
 import numpy as np
 from typing import Dict, List, Optional, Any, Union
 from pydantic import BaseModel, Field
@@ -168,6 +169,13 @@ TRAIT_NAME_TO_INDEX = {trait.name: trait.index for trait in TRAIT_DEFINITIONS}
 TRAIT_INDEX_TO_NAME = {trait.index: trait.name for trait in TRAIT_DEFINITIONS}
 
 
+@functools.lru_cache(maxsize=None)
+def _emotion_modifier():
+    """Shared emotional influence modifier, so its tables and caches persist across calls"""
+    from .emotional_influence import EmotionalPersonalityModifier
+    return EmotionalPersonalityModifier()
+
+
 class PersonalityArchetypes:
     """Preset personality vectors from famous personalities"""
     
@@ -468,8 +476,7 @@ class EnhancedPersonality(BaseModel):
         final_vector = evolved_vector
         if apply_emotional_influence and self.current_emotional_state:
             try:
-                from .emotional_influence import EmotionalPersonalityModifier
-                emotion_modifier = EmotionalPersonalityModifier()
+                emotion_modifier = _emotion_modifier()
                 
                 emotional_state_dict = {
                     'primary_emotion': self.current_emotional_state.primary_emotion,